@@ -0,0 +1,36 @@
+"""GiST index for appointment overlap detection.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2024-01-09 00:00:00.000000
+
+This migration creates:
+- btree_gist extension (lets provider_id share a GiST index with a range)
+- idx_appointments_provider_range on (provider_id, tstzrange(start_time, end_time))
+
+Conflict checks query the same tstzrange expression with the && overlap
+operator, so a busy provider's schedule is probed through the index
+instead of scanning every appointment that starts before the new one ends.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute("""
+        CREATE INDEX idx_appointments_provider_range ON appointments
+        USING GIST (provider_id, tstzrange(start_time, end_time))
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_appointments_provider_range")
@@ -0,0 +1,47 @@
+"""Exclusion constraint against overlapping appointments.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2024-01-10 00:00:00.000000
+
+This migration creates:
+- excl_appointments_provider_overlap: no two active (not cancelled or
+  no-show) appointments for one provider may have overlapping
+  tstzrange(start_time, end_time)
+
+The conflict check in the booking INSERT cannot see rows from
+transactions that have not committed yet, so two concurrent bookings
+could both pass it under READ COMMITTED. The constraint makes the
+database reject the second one. Upgrading fails if overlapping active
+appointments already exist; cancel or reschedule them first.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gist (for provider_id WITH =) was installed by 0009
+    op.execute("""
+        ALTER TABLE appointments
+        ADD CONSTRAINT excl_appointments_provider_overlap
+        EXCLUDE USING GIST (
+            provider_id WITH =,
+            tstzrange(start_time, end_time) WITH &&
+        )
+        WHERE (status NOT IN ('cancelled', 'no_show'))
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE appointments "
+        "DROP CONSTRAINT IF EXISTS excl_appointments_provider_overlap"
+    )
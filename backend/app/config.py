@@ -43,6 +43,15 @@ class Settings(BaseSettings):
     )
     db_pool_size: int = Field(default=5, ge=1, le=20)
     db_max_overflow: int = Field(default=10, ge=0, le=50)
+    db_pool_pre_ping: bool = Field(
+        default=False,
+        description="Ping pooled connections on checkout (one extra round trip each)",
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        ge=-1,
+        description="Replace pooled connections older than this many seconds",
+    )
 
     # ==========================================================================
     # Redis
@@ -121,6 +130,15 @@ class Settings(BaseSettings):
     ohif_url: str = Field(
         default="http://localhost:3001", description="OHIF Viewer URL"
     )
+    orthanc_native_search: bool = Field(
+        default=True,
+        description="Search studies via Orthanc /tools/find instead of QIDO-RS "
+        "(disable for non-Orthanc PACS)",
+    )
+    dicom_thumbnail_cache_dir: str = Field(
+        default="/tmp/openheart/thumbnails",
+        description="Local directory for cached study thumbnails",
+    )
 
     # ==========================================================================
     # S3/MinIO (File Storage)
@@ -0,0 +1,72 @@
+"""
+In-process caching utilities for OpenHeart Cyprus.
+
+Provides a small bounded TTL cache for hot lookups whose source of truth
+lives elsewhere (database, Orthanc, Gesy). Entries are per-worker and
+expire on their own, so callers only need to invalidate on writes they
+own.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Not thread-safe; intended for use from a single asyncio event loop,
+    where reads and writes never interleave mid-operation.
+
+    Example:
+        >>> cache: TTLCache[int, str] = TTLCache(maxsize=2, ttl=60)
+        >>> cache[1] = "a"
+        >>> cache.get(1)
+        'a'
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the cached value, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove an entry, returning its value if it was still live."""
+        entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
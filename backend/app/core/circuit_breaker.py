@@ -0,0 +1,93 @@
+"""
+Circuit breaker for calls to external services.
+
+When a dependency (Orthanc, Gesy) is down, every request otherwise waits
+out the full connect/read timeout before failing. The breaker counts
+consecutive failures and, once open, rejects calls immediately until a
+cool-down has passed, after which a single trial call is let through.
+"""
+
+import time
+from types import TracebackType
+from typing import Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Async context manager implementing a consecutive-failure breaker.
+
+    Not thread-safe; intended for use from a single asyncio event loop.
+
+    Example:
+        >>> breaker = CircuitBreaker(fail_max=5, reset_timeout=30)
+        >>> async with breaker:
+        ...     await client.get(url)
+    """
+
+    def __init__(
+        self,
+        fail_max: int,
+        reset_timeout: float,
+        exceptions: tuple[type[BaseException], ...] = (Exception,),
+    ) -> None:
+        """
+        Args:
+            fail_max: Consecutive failures before the circuit opens
+            reset_timeout: Seconds to stay open before allowing a trial call
+            exceptions: Exception types counted as failures; others pass
+                through without affecting the breaker
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.exceptions = exceptions
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        # Half-open: the single trial call is in flight
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being rejected."""
+        if self._opened_at is None:
+            return False
+        return (
+            self._probing
+            or time.monotonic() - self._opened_at < self.reset_timeout
+        )
+
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count."""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        if self.is_open:
+            raise CircuitOpenError("Circuit open; call rejected")
+        if self._opened_at is not None:
+            # Cool-down over: this call is the trial, later callers keep
+            # failing fast until it closes or re-opens the circuit
+            self._probing = True
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.reset()
+        elif issubclass(exc_type, self.exceptions):
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                # (Re)open; after reset_timeout one trial call gets through
+                self._opened_at = time.monotonic()
+                self._probing = False
+        else:
+            # Uncounted error or cancellation settles nothing; allow a new trial
+            self._probing = False
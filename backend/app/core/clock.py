@@ -0,0 +1,43 @@
+"""
+Clock utilities for OpenHeart Cyprus.
+
+Provides a timezone-aware UTC "now" that is read once per event loop
+iteration. Handlers that stamp several fields in the same step share one
+datetime instead of each paying for a clock read and a new object.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+_cached_now: Optional[datetime] = None
+_cached_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _expire() -> None:
+    """Drop the cached timestamp at the start of the next loop iteration."""
+    global _cached_now, _cached_loop
+    _cached_now = None
+    _cached_loop = None
+
+
+def utc_now() -> datetime:
+    """
+    Return the current UTC time, cached for the current loop iteration.
+
+    Outside a running event loop every call reads the clock.
+
+    Returns:
+        Timezone-aware datetime in UTC
+    """
+    global _cached_now, _cached_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return datetime.now(timezone.utc)
+
+    if _cached_now is None or _cached_loop is not loop:
+        _cached_now = datetime.now(timezone.utc)
+        _cached_loop = loop
+        loop.call_soon(_expire)
+    return _cached_now
@@ -8,6 +8,7 @@ as required by GDPR and Cyprus Law 125(I)/2018.
 import base64
 import hashlib
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from cryptography.fernet import Fernet, InvalidToken
@@ -17,12 +18,15 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def _get_fernet() -> Fernet:
     """
     Get Fernet instance with the configured encryption key.
 
     The key is derived from the configured PII_ENCRYPTION_KEY setting.
     If the key is not a valid Fernet key, it's derived using SHA-256.
+    The instance is built once and reused, so encrypt/decrypt calls on
+    the request path skip the key derivation.
 
     Returns:
         Fernet instance for encryption/decryption
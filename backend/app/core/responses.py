@@ -0,0 +1,35 @@
+"""
+Response classes for OpenHeart Cyprus.
+
+Thin wrappers around FastAPI's orjson-backed response that fix the
+serialization options used across the API.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class OpenHeartJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse with the options our payloads need.
+
+    - OPT_NAIVE_UTC: naive datetimes (e.g. parsed DICOM StudyDate/Time)
+      are emitted as UTC instead of without an offset.
+    - OPT_SERIALIZE_NUMPY: numpy scalars/arrays from measurement parsing
+      serialize natively.
+    - OPT_UTC_Z: UTC datetimes end in "Z", matching what Pydantic emits
+      for endpoints serialized through a response_model.
+    - OPT_NON_STR_KEYS: preserved from the FastAPI default.
+    """
+
+    OPTIONS = (
+        orjson.OPT_NAIVE_UTC
+        | orjson.OPT_UTC_Z
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self.OPTIONS)
@@ -0,0 +1,67 @@
+"""
+TTL Cache Unit Tests.
+
+Tests expiry, LRU eviction, and invalidation for the in-process TTLCache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_get_returns_stored_value(self):
+        """Stored values are returned until they expire."""
+        cache: TTLCache[int, str] = TTLCache(maxsize=4, ttl=60)
+        cache[1] = "CY123"
+        assert cache.get(1) == "CY123"
+        assert 1 in cache
+
+    def test_missing_key_returns_default(self):
+        """Missing keys return the supplied default."""
+        cache: TTLCache[int, str] = TTLCache(maxsize=4, ttl=60)
+        assert cache.get(1) is None
+        assert cache.get(1, "fallback") == "fallback"
+
+    def test_empty_string_is_a_hit(self):
+        """Falsy values are cached, not treated as misses."""
+        cache: TTLCache[int, str] = TTLCache(maxsize=4, ttl=60)
+        cache[1] = ""
+        assert cache.get(1) == ""
+
+    def test_entries_expire(self):
+        """Entries past their TTL are dropped on read."""
+        cache: TTLCache[int, str] = TTLCache(maxsize=4, ttl=10)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache[1] = "a"
+        with patch("app.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Exceeding maxsize evicts the least recently used entry."""
+        cache: TTLCache[int, str] = TTLCache(maxsize=2, ttl=60)
+        cache[1] = "a"
+        cache[2] = "b"
+        cache.get(1)  # 2 is now least recently used
+        cache[3] = "c"
+        assert cache.get(2) is None
+        assert cache.get(1) == "a"
+        assert cache.get(3) == "c"
+
+    def test_pop_invalidates(self):
+        """pop() removes the entry and returns its value."""
+        cache: TTLCache[int, str] = TTLCache(maxsize=4, ttl=60)
+        cache[1] = "a"
+        assert cache.pop(1) == "a"
+        assert cache.get(1) is None
+        assert cache.pop(1) is None
+
+    def test_invalid_maxsize_rejected(self):
+        """maxsize must be positive."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0, ttl=60)
@@ -0,0 +1,85 @@
+"""Tests for the circuit breaker."""
+
+import asyncio
+
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+async def _fail(breaker: CircuitBreaker, exc: Exception) -> None:
+    with pytest.raises(type(exc)):
+        async with breaker:
+            raise exc
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    async def test_opens_after_fail_max(self):
+        """Consecutive failures should open the circuit and reject calls."""
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=60)
+        await _fail(breaker, ConnectionError())
+        assert not breaker.is_open
+        await _fail(breaker, ConnectionError())
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            async with breaker:
+                pass
+
+    async def test_success_resets_failures(self):
+        """A successful call should clear the failure count."""
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=60)
+        await _fail(breaker, ConnectionError())
+        async with breaker:
+            pass
+        await _fail(breaker, ConnectionError())
+        assert not breaker.is_open
+
+    async def test_uncounted_exceptions_pass_through(self):
+        """Exceptions outside the configured types should not trip the breaker."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=60, exceptions=(OSError,))
+        await _fail(breaker, ValueError())
+        assert not breaker.is_open
+
+    async def test_half_open_after_reset_timeout(self):
+        """After the timeout a trial call is allowed and success closes the circuit."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=0)
+        await _fail(breaker, ConnectionError())
+        async with breaker:
+            pass
+        assert not breaker.is_open
+
+    async def test_single_trial_call_when_half_open(self):
+        """Concurrent callers at reset should let exactly one trial through."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=0)
+        await _fail(breaker, ConnectionError())
+        release = asyncio.Event()
+
+        async def call() -> None:
+            async with breaker:
+                await release.wait()
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert breaker.is_open
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert results.count(None) == 1
+        assert all(
+            isinstance(result, CircuitOpenError) for result in results if result
+        )
+        assert not breaker.is_open
+
+    async def test_failed_trial_reopens(self):
+        """A failing trial call should re-open the circuit for a new cool-down."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=0)
+        await _fail(breaker, ConnectionError())
+        breaker.reset_timeout = 60
+        breaker._opened_at -= 60
+        await _fail(breaker, ConnectionError())
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            async with breaker:
+                pass
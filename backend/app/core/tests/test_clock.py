@@ -0,0 +1,29 @@
+"""
+Clock Unit Tests.
+
+Tests the per-loop-iteration caching of utc_now().
+"""
+
+import asyncio
+from datetime import timezone
+
+from app.core.clock import utc_now
+
+
+class TestUtcNow:
+    """Test utc_now behaviour."""
+
+    def test_timezone_aware_outside_loop(self):
+        """Calls outside an event loop return a fresh aware datetime."""
+        assert utc_now().tzinfo is timezone.utc
+
+    async def test_cached_within_iteration(self):
+        """Calls within one loop iteration share the same object."""
+        assert utc_now() is utc_now()
+
+    async def test_refreshed_next_iteration(self):
+        """The cached value is dropped once the loop advances."""
+        first = utc_now()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert utc_now() is not first
@@ -0,0 +1,27 @@
+"""Tests for the shared JSON response class."""
+
+from datetime import datetime, timezone
+
+import orjson
+
+from app.core.responses import OpenHeartJSONResponse
+
+
+class TestOpenHeartJSONResponse:
+    """Tests for OpenHeartJSONResponse rendering."""
+
+    def test_naive_datetime_rendered_as_utc(self):
+        """Naive datetimes should carry an explicit UTC offset."""
+        response = OpenHeartJSONResponse({"at": datetime(2024, 1, 2, 3, 4, 5)})
+        assert orjson.loads(response.body) == {"at": "2024-01-02T03:04:05Z"}
+
+    def test_aware_utc_datetime_uses_z_suffix(self):
+        """Aware UTC datetimes should match Pydantic's "Z" form."""
+        at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        response = OpenHeartJSONResponse({"at": at})
+        assert orjson.loads(response.body) == {"at": "2024-01-02T03:04:05Z"}
+
+    def test_non_string_keys_allowed(self):
+        """Integer keys should still serialize as in the FastAPI default."""
+        response = OpenHeartJSONResponse({1: "a"})
+        assert orjson.loads(response.body) == {"1": "a"}
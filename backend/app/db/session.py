@@ -6,19 +6,24 @@ Provides async SQLAlchemy session handling with connection pooling.
 
 from typing import AsyncGenerator
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, SessionTransaction
 from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
-# Create async engine with connection pooling
+# Create async engine with connection pooling. Pre-ping is off by default:
+# it costs a round trip on every checkout, while a dropped connection
+# already invalidates the pool on first use and recycling retires idle
+# connections before server-side timeouts reach them.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
-    pool_pre_ping=True,  # Verify connections before use
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=settings.db_pool_recycle,
 )
 
 # Create async session factory
@@ -31,6 +36,17 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# session.info key recording the clinic whose RLS context is already set
+_TENANT_INFO_KEY = "tenant_clinic_id"
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _reset_tenant_marker(session: Session, transaction: SessionTransaction) -> None:
+    """Forget the tenant context once the connection goes back to the pool."""
+    if transaction.parent is None:
+        session.info.pop(_TENANT_INFO_KEY, None)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session.
@@ -49,15 +65,20 @@ async def set_tenant_context(session: AsyncSession, clinic_id: int) -> None:
     Set PostgreSQL session variable for Row-Level Security.
 
     This must be called before any queries to patient data
-    to ensure RLS policies filter correctly.
+    to ensure RLS policies filter correctly. Repeat calls for the same
+    clinic within one transaction are skipped, since the setting is
+    already in place on the connection.
 
     Args:
         session: The database session
         clinic_id: The clinic ID for tenant isolation
     """
+    if session.info.get(_TENANT_INFO_KEY) == clinic_id:
+        return
     await session.execute(
         text(f"SET app.clinic_id = '{clinic_id}'")
     )
+    session.info[_TENANT_INFO_KEY] = clinic_id
 
 
 async def set_user_context(session: AsyncSession, user_id: int) -> None:
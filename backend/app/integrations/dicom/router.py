@@ -5,17 +5,36 @@ Provides REST endpoints for DICOM imaging operations including
 study search, retrieval, and OHIF viewer integration.
 """
 
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
 from datetime import date
-from typing import Annotated, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from fastapi.responses import StreamingResponse
+from pathlib import Path
+from typing import Annotated, AsyncIterator, BinaryIO, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import FileResponse, StreamingResponse
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.config import settings
 from app.core.encryption import decrypt_pii
 from app.core.permissions import Permission, require_permission
+from app.core.redis import get_redis
+from app.core.responses import OpenHeartJSONResponse
 from app.core.security import TokenPayload, get_current_user
 from app.db.session import get_db
 from app.integrations.dicom.models import PatientStudyLink
@@ -23,19 +42,97 @@ from app.integrations.dicom.schemas import (
     DicomStudy,
     DicomStudyList,
     EchoMeasurements,
+    MODALITY_VALUE,
     Modality,
+    StudyCursor,
     StudySearchRequest,
     ViewerUrlResponse,
 )
 from app.integrations.dicom.service import DicomService
-from app.modules.patient.models import Patient
+from app.modules.patient.models import Patient, PatientPII
+from app.modules.patient.service import cyprus_id_cache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/dicom",
+    tags=["DICOM/Imaging"],
+    default_response_class=OpenHeartJSONResponse,
+)
+
+
+def get_dicom_service(request: Request) -> DicomService:
+    """Dependency to get the application-wide DICOM service."""
+    return request.app.state.dicom_service
+
+
+# Thumbnails are private clinical images; never let shared caches keep them
+THUMBNAIL_CACHE_HEADERS = {"Cache-Control": "private, max-age=86400"}
+
+
+def _thumbnail_cache_path(study_uid: str) -> Path:
+    """Cache file for a study thumbnail (hashed so the UID never forms a path)."""
+    digest = hashlib.sha256(study_uid.encode()).hexdigest()
+    return Path(settings.dicom_thumbnail_cache_dir) / f"{digest}.jpg"
+
 
-router = APIRouter(prefix="/dicom", tags=["DICOM/Imaging"])
+# Study metadata changes rarely once archived; a short Redis TTL turns most
+# detail reads into a single GET instead of three Orthanc round-trips.
+STUDY_CACHE_PREFIX = "dicom:study:"
+STUDY_CACHE_TTL_SECONDS = 60
+STUDY_CACHE_HEADERS = {
+    "Cache-Control": f"private, max-age={STUDY_CACHE_TTL_SECONDS}, "
+    "stale-while-revalidate=300",
+}
 
 
-def get_dicom_service() -> DicomService:
-    """Dependency to get DICOM service instance."""
-    return DicomService()
+def _study_cache_key(study_uid: str, prefetch_thumbnails: bool) -> str:
+    """Redis key for a serialized study (with or without thumbnails)."""
+    suffix = ":previews" if prefetch_thumbnails else ""
+    return f"{STUDY_CACHE_PREFIX}{study_uid}{suffix}"
+
+
+async def _cache_thumbnail_stream(
+    chunks: AsyncIterator[bytes], path: Path
+) -> AsyncIterator[bytes]:
+    """
+    Relay thumbnail chunks while writing them through to the disk cache.
+
+    The cache file is written under a temporary name and only moved into
+    place once the full image has been relayed, so an aborted transfer
+    never leaves a truncated thumbnail behind.
+    """
+    try:
+        tmp = await asyncio.to_thread(_open_thumbnail_tmp, path)
+    except OSError as e:
+        logger.warning(f"Failed to cache thumbnail {path.name}: {e}")
+        tmp = None
+
+    complete = False
+    try:
+        async for chunk in chunks:
+            if tmp is not None:
+                await asyncio.to_thread(tmp.write, chunk)
+            yield chunk
+        complete = True
+    finally:
+        if tmp is not None:
+            await asyncio.to_thread(_finish_thumbnail_tmp, tmp, path, complete)
+
+
+def _open_thumbnail_tmp(path: Path) -> BinaryIO:
+    """Open a uniquely named temporary file beside the cache path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False)
+
+
+def _finish_thumbnail_tmp(tmp: BinaryIO, path: Path, complete: bool) -> None:
+    """Atomically publish a completed cache file, or discard a partial one."""
+    tmp.close()
+    if complete:
+        os.replace(tmp.name, path)
+    else:
+        Path(tmp.name).unlink(missing_ok=True)
 
 
 # =============================================================================
@@ -43,7 +140,9 @@ def get_dicom_service() -> DicomService:
 # =============================================================================
 
 
-@router.get("/studies", response_model=DicomStudyList)
+@router.get(
+    "/studies", response_model=DicomStudyList, response_model_exclude_none=True
+)
 async def search_studies(
     user: Annotated[TokenPayload, Depends(get_current_user)],
     dicom: Annotated[DicomService, Depends(get_dicom_service)],
@@ -57,16 +156,29 @@ async def search_studies(
     linked_patient_id: Optional[int] = Query(None, description="OpenHeart patient ID"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Results per page"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
+    ),
 ):
     """
     Search for DICOM studies.
 
     Uses QIDO-RS to query the Orthanc PACS server. Supports filtering
-    by patient demographics, dates, and modality.
+    by patient demographics, dates, and modality. Results are ordered
+    newest first; follow next_cursor for constant-cost paging instead
+    of large page offsets.
 
     Permissions: Any authenticated user can search studies.
     Clinical data access is filtered by clinic_id.
     """
+    try:
+        after = StudyCursor.decode(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
     request = StudySearchRequest(
         patient_id=patient_id,
         patient_name=patient_name,
@@ -78,35 +190,69 @@ async def search_studies(
         linked_patient_id=linked_patient_id,
         page=page,
         per_page=per_page,
+        after=after,
     )
 
     return await dicom.search_studies(request)
 
 
-@router.get("/studies/{study_uid}", response_model=DicomStudy)
+@router.get(
+    "/studies/{study_uid}",
+    response_model=DicomStudy,
+    response_model_exclude_none=True,
+)
 async def get_study(
     study_uid: str,
     user: Annotated[TokenPayload, Depends(get_current_user)],
     dicom: Annotated[DicomService, Depends(get_dicom_service)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    prefetch_thumbnails: bool = Query(
+        False, description="Embed base64 thumbnails for the first series"
+    ),
 ):
     """
     Get detailed study metadata including series information.
 
+    Serialized responses are cached in Redis for a short TTL; a Redis
+    outage only disables the cache.
+
     Args:
         study_uid: Study Instance UID
+        prefetch_thumbnails: Fetch series thumbnails concurrently and
+            embed them, saving the client one request per series
     """
-    study = await dicom.get_study(study_uid)
+    cache_key = _study_cache_key(study_uid, prefetch_thumbnails)
+    try:
+        cached = await redis.get(cache_key)
+    except RedisError as e:
+        logger.warning(f"Study cache read failed for {study_uid}: {e}")
+        cached = None
+    if cached:
+        return Response(
+            content=cached, media_type="application/json", headers=STUDY_CACHE_HEADERS
+        )
+
+    study = await dicom.get_study(study_uid, prefetch_thumbnails=prefetch_thumbnails)
     if not study:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Study not found",
         )
-    return study
+
+    payload = study.model_dump_json(exclude_none=True)
+    try:
+        await redis.set(cache_key, payload, ex=STUDY_CACHE_TTL_SECONDS)
+    except RedisError as e:
+        logger.warning(f"Study cache write failed for {study_uid}: {e}")
+    return Response(
+        content=payload, media_type="application/json", headers=STUDY_CACHE_HEADERS
+    )
 
 
 @router.get("/studies/{study_uid}/viewer-url", response_model=ViewerUrlResponse)
 async def get_viewer_url(
     study_uid: str,
+    response: Response,
     user: Annotated[TokenPayload, Depends(get_current_user)],
     dicom: Annotated[DicomService, Depends(get_dicom_service)],
 ):
@@ -114,8 +260,10 @@ async def get_viewer_url(
     Get OHIF Viewer URL for a study.
 
     Returns a URL that can be embedded in an iframe or opened
-    in a new window to view the study in OHIF Viewer.
+    in a new window to view the study in OHIF Viewer. The URL is
+    derived from configuration only, so clients may cache it.
     """
+    response.headers.update(STUDY_CACHE_HEADERS)
     return await dicom.get_viewer_url(study_uid)
 
 
@@ -128,15 +276,29 @@ async def get_study_thumbnail(
     """
     Get a thumbnail preview image for a study.
 
-    Returns a JPEG thumbnail of the first image in the study.
+    Returns a JPEG thumbnail of the first image in the study. Misses are
+    streamed from Orthanc and written through to a local disk cache;
+    hits are sent with FileResponse so the file goes to the socket
+    without being read into Python.
     """
-    thumbnail = await dicom.get_study_thumbnail(study_uid)
-    if not thumbnail:
+    cache_path = _thumbnail_cache_path(study_uid)
+    if cache_path.is_file():
+        return FileResponse(
+            cache_path, media_type="image/jpeg", headers=THUMBNAIL_CACHE_HEADERS
+        )
+
+    thumbnail = await dicom.stream_study_thumbnail(study_uid)
+    if thumbnail is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Thumbnail not available",
         )
-    return Response(content=thumbnail, media_type="image/jpeg")
+
+    return StreamingResponse(
+        _cache_thumbnail_stream(thumbnail, cache_path),
+        media_type="image/jpeg",
+        headers=THUMBNAIL_CACHE_HEADERS,
+    )
 
 
 # =============================================================================
@@ -183,6 +345,7 @@ async def delete_study(
         Depends(require_permission(Permission.DICOM_DELETE)),
     ],
     dicom: Annotated[DicomService, Depends(get_dicom_service)],
+    redis: Annotated[Redis, Depends(get_redis)],
 ):
     """
     Delete a study from the PACS.
@@ -198,6 +361,13 @@ async def delete_study(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Study not found or could not be deleted",
         )
+    _thumbnail_cache_path(study_uid).unlink(missing_ok=True)
+    try:
+        await redis.delete(
+            _study_cache_key(study_uid, False), _study_cache_key(study_uid, True)
+        )
+    except RedisError as e:
+        logger.warning(f"Study cache invalidation failed for {study_uid}: {e}")
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -256,37 +426,37 @@ async def link_study_to_patient(
             detail="Study not found",
         )
 
-    # Check for existing link (prevent duplicates)
-    existing = await db.execute(
-        select(PatientStudyLink).where(
-            PatientStudyLink.study_instance_uid == study_uid,
-            PatientStudyLink.patient_id == patient_id,
+    # Insert the link with cached study metadata in one round trip. The
+    # unique constraint on (study_instance_uid, patient_id) detects an
+    # existing link: no row returned means the study is already linked.
+    stmt = (
+        pg_insert(PatientStudyLink)
+        .values(
+            study_instance_uid=study_uid,
+            patient_id=patient_id,
+            encounter_id=encounter_id,
+            clinic_id=user.clinic_id,
+            linked_by_user_id=user.sub,
+            link_reason=link_reason,
+            study_date=study.study_date,
+            study_description=study.study_description,
+            modality=(
+                MODALITY_VALUE[study.modalities[0]] if study.modalities else None
+            ),
         )
+        .on_conflict_do_nothing(index_elements=["study_instance_uid", "patient_id"])
+        .returning(PatientStudyLink.id)
     )
-    if existing.scalar_one_or_none():
+    link_id = (await db.execute(stmt)).scalar_one_or_none()
+    if link_id is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Study is already linked to this patient",
         )
-
-    # Create link with cached study metadata
-    link = PatientStudyLink(
-        study_instance_uid=study_uid,
-        patient_id=patient_id,
-        encounter_id=encounter_id,
-        clinic_id=user.clinic_id,
-        linked_by_user_id=user.sub,
-        link_reason=link_reason,
-        study_date=study.study_date if study else None,
-        study_description=study.study_description if study else None,
-        modality=study.modalities[0].value if study and study.modalities else None,
-    )
-    db.add(link)
     await db.commit()
-    await db.refresh(link)
 
     return {
-        "id": link.id,
+        "id": link_id,
         "study_instance_uid": study_uid,
         "patient_id": patient_id,
         "encounter_id": encounter_id,
@@ -295,7 +465,11 @@ async def link_study_to_patient(
     }
 
 
-@router.get("/patients/{patient_id}/studies", response_model=DicomStudyList)
+@router.get(
+    "/patients/{patient_id}/studies",
+    response_model=DicomStudyList,
+    response_model_exclude_none=True,
+)
 async def get_patient_studies(
     patient_id: int,
     user: Annotated[TokenPayload, Depends(get_current_user)],
@@ -315,36 +489,50 @@ async def get_patient_studies(
     """
     studies_by_uid: dict[str, DicomStudy] = {}
 
-    # 1. Get patient's Cyprus ID from encrypted PII for Orthanc lookup
-    result = await db.execute(
-        select(Patient)
-        .options(selectinload(Patient.pii))
-        .where(Patient.patient_id == patient_id)
+    # Checked on every call (the cache below is not an access check)
+    exists = await db.execute(
+        select(Patient.patient_id).where(Patient.patient_id == patient_id)
     )
-    patient = result.scalar_one_or_none()
-    if not patient:
+    if exists.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Patient not found",
         )
 
+    # 1. Get patient's Cyprus ID from encrypted PII for Orthanc lookup
+    cache_key = (user.clinic_id, patient_id)
+    cyprus_id = cyprus_id_cache.get(cache_key)
+    if cyprus_id is None:
+        pii_result = await db.execute(
+            select(PatientPII.cyprus_id_encrypted).where(
+                PatientPII.patient_id == patient_id
+            )
+        )
+        cyprus_id_encrypted = pii_result.scalar_one_or_none()
+
+        cyprus_id = ""
+        if cyprus_id_encrypted:
+            try:
+                cyprus_id = decrypt_pii(cyprus_id_encrypted)
+            except ValueError:
+                # Undecryptable ID; continue with DB links only
+                pass
+        cyprus_id_cache[cache_key] = cyprus_id
+
     # Query Orthanc using the patient's Cyprus ID as DICOM Patient ID
-    if patient.pii and patient.pii.cyprus_id_encrypted:
-        try:
-            cyprus_id = decrypt_pii(patient.pii.cyprus_id_encrypted)
-            if cyprus_id:
-                search_request = StudySearchRequest(
-                    patient_id=cyprus_id,
-                    page=1,
-                    per_page=100,  # Get all matching studies
-                )
-                orthanc_results = await dicom.search_studies(search_request)
-                for study in orthanc_results.studies:
-                    study.linked_patient_id = patient_id
-                    studies_by_uid[study.study_instance_uid] = study
-        except Exception:
-            # Orthanc may be unavailable; continue with DB links only
-            pass
+    # (search_studies returns an empty list when Orthanc is unreachable or
+    # its circuit breaker is open, so the DB links below still load)
+    if cyprus_id:
+        search_request = StudySearchRequest(
+            patient_id=cyprus_id,
+            page=1,
+            per_page=100,  # Get all matching studies
+        )
+        orthanc_results = await dicom.search_studies(search_request)
+        for study in orthanc_results.studies:
+            studies_by_uid[study.study_instance_uid] = study.model_copy(
+                update={"linked_patient_id": patient_id}
+            )
 
     # 2. Query manually linked studies from database
     db_result = await db.execute(
@@ -366,7 +554,9 @@ async def get_patient_studies(
             )
         else:
             # Update existing entry with link metadata
-            studies_by_uid[link.study_instance_uid].linked_encounter_id = link.encounter_id
+            studies_by_uid[link.study_instance_uid] = studies_by_uid[
+                link.study_instance_uid
+            ].model_copy(update={"linked_encounter_id": link.encounter_id})
 
     # Sort by study date (most recent first), nulls last
     all_studies = sorted(
@@ -386,4 +576,5 @@ async def get_patient_studies(
         total=total,
         page=page,
         per_page=per_page,
+        has_next=end < total,
     )
@@ -5,11 +5,14 @@ Defines Pydantic models for DICOM metadata and cardiology-specific
 structured reports (Echo, Cath Lab).
 """
 
+import base64
+import binascii
+from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Modality(str, Enum):
@@ -25,6 +28,14 @@ class Modality(str, Enum):
     SR = "SR"  # Structured Report
 
 
+# Member -> code lookup for hot paths that need the raw string
+MODALITY_VALUE: dict[Modality, str] = {m: m.value for m in Modality}
+
+# Code -> member lookup for parsing; unknown vendor codes miss with .get()
+# instead of raising ValueError from Modality(code)
+MODALITY_BY_CODE: dict[str, Modality] = {m.value: m for m in Modality}
+
+
 class StudyStatus(str, Enum):
     """Status of DICOM study in OpenHeart."""
 
@@ -48,6 +59,10 @@ class DicomPatient(BaseModel):
     birth_date: Optional[date] = Field(None, description="Birth date (DICOM 0010,0030)")
     sex: Optional[str] = Field(None, description="Patient sex M/F/O (DICOM 0010,0040)")
 
+    # Built in bulk from Orthanc responses and never mutated in place;
+    # derive variants with model_copy(update=...).
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class DicomInstance(BaseModel):
     """Single DICOM instance (image or document)."""
@@ -60,6 +75,10 @@ class DicomInstance(BaseModel):
     columns: Optional[int] = Field(None, description="Image columns (DICOM 0028,0011)")
     frames: Optional[int] = Field(None, description="Number of frames (DICOM 0028,0008)")
 
+    # Built in bulk from Orthanc responses and never mutated in place;
+    # derive variants with model_copy(update=...).
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class DicomSeries(BaseModel):
     """DICOM series containing multiple instances."""
@@ -71,10 +90,24 @@ class DicomSeries(BaseModel):
     body_part: Optional[str] = Field(None, description="Body part examined (DICOM 0018,0015)")
     instance_count: int = Field(0, description="Number of instances")
     instances: list[DicomInstance] = Field(default_factory=list)
+    thumbnail: Optional[str] = Field(
+        None, description="Base64 JPEG thumbnail (only when prefetched)"
+    )
+
+    # Built in bulk from Orthanc responses and never mutated in place;
+    # derive variants with model_copy(update=...).
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 class DicomStudy(BaseModel):
-    """DICOM study representing a single imaging exam."""
+    """
+    DICOM study representing a single imaging exam.
+
+    Studies returned by search (list mode) populate only the fields the
+    study list renders: study_date, study_description, accession_number,
+    modalities, series_count and patient name/ID. Studies loaded with
+    get_study populate every field, including series.
+    """
 
     study_instance_uid: str = Field(..., description="Study UID (DICOM 0020,000D)")
     study_id: Optional[str] = Field(None, description="Study ID (DICOM 0020,0010)")
@@ -100,14 +133,26 @@ class DicomStudy(BaseModel):
     linked_patient_id: Optional[int] = Field(None, description="OpenHeart patient ID")
     linked_encounter_id: Optional[int] = Field(None, description="OpenHeart encounter ID")
 
+    # Built in bulk from Orthanc responses and never mutated in place;
+    # derive variants with model_copy(update=...).
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class DicomStudyList(BaseModel):
     """Paginated list of DICOM studies."""
 
     studies: list[DicomStudy]
-    total: int
+    total: Optional[int] = Field(
+        None,
+        description="Deprecated: only set when the full result size is known; "
+        "page with next_cursor instead",
+    )
     page: int
     per_page: int
+    has_next: bool = Field(False, description="Whether another page exists")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page; absent on the last page"
+    )
 
 
 # =============================================================================
@@ -362,19 +407,130 @@ class CathLabReport(BaseModel):
 # =============================================================================
 
 
-class StudySearchRequest(BaseModel):
-    """Search parameters for DICOM studies."""
-
-    patient_id: Optional[str] = Field(None, description="DICOM Patient ID")
-    patient_name: Optional[str] = Field(None, description="Patient name (wildcard *)")
+def parse_dicom_date(date_str: Optional[str]) -> Optional[date]:
+    """
+    Parse DICOM date format (YYYYMMDD) to Python date.
+
+    Slices the fixed-width digits directly; strptime re-parses its
+    format string on every call and this runs for every date in every
+    search row.
+    """
+    if not date_str or len(date_str) != 8 or not date_str.isdigit():
+        return None
+    try:
+        return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    except ValueError:
+        return None
+
+
+def to_dicom_date(value: date) -> str:
+    """Format a date as DICOM DA (YYYYMMDD) without strftime."""
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+
+
+@dataclass(slots=True, frozen=True)
+class StudyCursor:
+    """
+    Resume position in a study search ordered by (StudyDate desc, UID asc).
+
+    With a study_date, the next page caps the StudyDate range at that date
+    and skips the `skip` studies on it that were already returned, so
+    Orthanc never rescans earlier days. Without one (undated studies, which
+    sort last, or when the run on the last date could not be measured) the
+    next page resumes at absolute offset `seen`, the number of studies
+    returned so far.
+
+    Encoded as an opaque URL-safe token so clients just echo back the
+    previous page's next_cursor.
+    """
+
+    study_date: str  # DICOM DA (YYYYMMDD), or "" to resume by absolute offset
+    skip: int  # Studies on study_date already returned
+    seen: int  # Studies returned so far in the whole scan
+
+    def encode(self) -> str:
+        raw = f"{self.study_date}|{self.skip}|{self.seen}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "StudyCursor":
+        """
+        Decode a token produced by encode().
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError("Invalid cursor") from e
+        parts = raw.split("|")
+        if len(parts) != 3:
+            raise ValueError("Invalid cursor")
+        study_date, skip, seen = parts
+        if (
+            (study_date and not (len(study_date) == 8 and study_date.isdigit()))
+            or not skip.isdigit()
+            or not seen.isdigit()
+        ):
+            raise ValueError("Invalid cursor")
+        return cls(study_date, int(skip), int(seen))
+
+
+@dataclass(slots=True, frozen=True)
+class StudySearchRequest:
+    """
+    Search parameters for DICOM studies.
+
+    Internal value object passed from the router to DicomService. The
+    router's Query parameters already validate these fields, so this is a
+    plain dataclass rather than a model that would validate them again.
+    """
+
+    patient_id: Optional[str] = None  # DICOM Patient ID
+    patient_name: Optional[str] = None  # Wildcard (*) match
     accession_number: Optional[str] = None
     study_date_from: Optional[date] = None
     study_date_to: Optional[date] = None
     modality: Optional[Modality] = None
     study_description: Optional[str] = None
-    linked_patient_id: Optional[int] = Field(None, description="OpenHeart patient ID")
-    page: int = Field(1, ge=1)
-    per_page: int = Field(20, ge=1, le=100)
+    linked_patient_id: Optional[int] = None  # OpenHeart patient ID
+    page: int = 1
+    per_page: int = 20
+    after: Optional[StudyCursor] = None  # Search cursor; replaces page offset
+
+    def to_qido_params(self) -> list[tuple[str, str]]:
+        """
+        Build the QIDO-RS filter parameters for this search.
+
+        Pagination and includefield are added by the caller; httpx
+        URL-encodes the returned pairs once when sending. With a keyset
+        cursor the date range is capped at the cursor's StudyDate so
+        Orthanc never rescans earlier pages.
+        """
+        params: list[tuple[str, str]] = []
+        if self.patient_id:
+            params.append(("PatientID", self.patient_id))
+        if self.patient_name:
+            params.append(("PatientName", f"*{self.patient_name}*"))
+        if self.accession_number:
+            params.append(("AccessionNumber", self.accession_number))
+        if self.study_description:
+            params.append(("StudyDescription", f"*{self.study_description}*"))
+        if self.modality:
+            params.append(("ModalitiesInStudy", self.modality.value))
+
+        # Date range filter (DICOM format: YYYYMMDD-YYYYMMDD). Never send a
+        # bare "-": Orthanc treats it as match-all and scans every study.
+        date_from = to_dicom_date(self.study_date_from) if self.study_date_from else ""
+        date_to = to_dicom_date(self.study_date_to) if self.study_date_to else ""
+        if self.after and self.after.study_date:
+            date_to = min(date_to, self.after.study_date) if date_to else self.after.study_date
+        if date_from and date_from == date_to:
+            params.append(("StudyDate", date_from))
+        elif date_from or date_to:
+            params.append(("StudyDate", f"{date_from}-{date_to}"))
+        return params
 
 
 class StudyLinkRequest(BaseModel):
@@ -7,14 +7,19 @@ Uses QIDO-RS for queries and WADO-RS for retrieving images/metadata.
 Reference: https://www.dicomstandard.org/using/dicomweb
 """
 
+import asyncio
+import base64
 import logging
-from datetime import date, datetime
-from typing import Optional
-from urllib.parse import urljoin
+import uuid
+from dataclasses import replace
+from typing import AsyncIterator, Callable, Iterator, Optional
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.core.cache import TTLCache
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from app.integrations.dicom.schemas import (
     DicomInstance,
     DicomPatient,
@@ -22,10 +27,14 @@ from app.integrations.dicom.schemas import (
     DicomStudy,
     DicomStudyList,
     EchoMeasurements,
+    MODALITY_BY_CODE,
     Modality,
+    StudyCursor,
     StudySearchRequest,
     StudyStatus,
     ViewerUrlResponse,
+    parse_dicom_date,
+    to_dicom_date,
 )
 
 logger = logging.getLogger(__name__)
@@ -59,6 +68,73 @@ DICOM_TAGS = {
     "NumberOfStudyRelatedInstances": "00201208",
 }
 
+# Study attributes the study list view renders, requested by QIDO-RS search.
+# Every extra includefield makes Orthanc read more of each study, so the
+# list only asks for these (joined once at import).
+QIDO_STUDY_LIST_FIELDS = ",".join((
+    "00080020",  # StudyDate
+    "00081030",  # StudyDescription
+    "00080050",  # AccessionNumber
+    "00080060",  # ModalitiesInStudy
+    "00100010",  # PatientName
+    "00100020",  # PatientID
+    "00201206",  # NumberOfStudyRelatedSeries
+))
+
+# Full study attribute set, requested only when loading a single study
+QIDO_STUDY_DETAIL_FIELDS = ",".join((
+    "00080020",  # StudyDate
+    "00080030",  # StudyTime
+    "00081030",  # StudyDescription
+    "00080050",  # AccessionNumber
+    "00080060",  # ModalitiesInStudy
+    "00100010",  # PatientName
+    "00100020",  # PatientID
+    "00100030",  # PatientBirthDate
+    "00100040",  # PatientSex
+    "00080090",  # ReferringPhysician
+    "00080080",  # InstitutionName
+    "00201206",  # NumberOfStudyRelatedSeries
+    "00201208",  # NumberOfStudyRelatedInstances
+))
+
+# Study search order: newest first, UID breaks same-day ties
+QIDO_STUDY_ORDER = "-00080020,0020000D"
+ORTHANC_STUDY_ORDER = [
+    {"Type": "DicomTag", "Key": "StudyDate", "Direction": "DESC"},
+    {"Type": "DicomTag", "Key": "StudyInstanceUID", "Direction": "ASC"},
+]
+# Statuses meaning this server has no /tools/find (older Orthanc, other PACS)
+_TOOLS_FIND_UNSUPPORTED = frozenset({404, 405})
+
+
+def _next_study_cursor(
+    window: list[Optional[DicomStudy]],
+    after: Optional[StudyCursor],
+    start: int,
+) -> StudyCursor:
+    """Cursor for the page after window, which began at absolute offset start."""
+    seen = start + len(window)
+    dates = [
+        to_dicom_date(study.study_date) if study and study.study_date else ""
+        for study in window
+    ]
+    last = dates[-1]
+    if not last:
+        return StudyCursor("", 0, seen)
+    run = next(
+        (i for i, study_date in enumerate(reversed(dates)) if study_date != last),
+        len(dates),
+    )
+    if run < len(dates) or start == 0:
+        return StudyCursor(last, run, seen)
+    # The whole page is one date; count that date's studies on earlier pages
+    if after is not None and after.study_date:
+        skip = after.skip if after.study_date == last else 0
+        return StudyCursor(last, skip + run, seen)
+    # Unknown how many came before the page: resume by absolute offset
+    return StudyCursor("", 0, seen)
+
 
 def get_tag_value(data: dict, tag_name: str, default=None):
     """
@@ -83,14 +159,206 @@ def get_tag_value(data: dict, tag_name: str, default=None):
     return value
 
 
-def parse_dicom_date(date_str: Optional[str]) -> Optional[date]:
-    """Parse DICOM date format (YYYYMMDD) to Python date."""
-    if not date_str:
-        return None
+# =============================================================================
+# Field tables for bulk QIDO parsing
+# =============================================================================
+# Each entry is (model field, DICOM tag, converter applied to the first
+# value). Resolving tags once here lets the per-row parsers do a single
+# pass over the response instead of ~15 get_tag_value() calls per row.
+
+
+def _person_name(value) -> str:
+    """Render a PN value, preferring its Alphabetic component."""
+    if isinstance(value, dict):
+        return value.get("Alphabetic", str(value))
+    return value
+
+
+def _as_int(value) -> int:
+    """Coerce an IS/US value, treating empty as zero."""
+    return int(value or 0)
+
+
+def _identity(value):
+    return value
+
+
+_STUDY_FIELDS: tuple[tuple[str, str, Callable], ...] = (
+    ("study_id", "00200010", _identity),
+    ("accession_number", DICOM_TAGS["AccessionNumber"], _identity),
+    ("study_date", DICOM_TAGS["StudyDate"], parse_dicom_date),
+    ("study_time", DICOM_TAGS["StudyTime"], _identity),
+    ("study_description", DICOM_TAGS["StudyDescription"], _identity),
+    ("referring_physician", DICOM_TAGS["ReferringPhysicianName"], _person_name),
+    ("institution_name", DICOM_TAGS["InstitutionName"], _identity),
+    ("series_count", DICOM_TAGS["NumberOfStudyRelatedSeries"], _as_int),
+)
+
+_PATIENT_FIELDS: tuple[tuple[str, str, Callable], ...] = (
+    ("patient_id", DICOM_TAGS["PatientID"], _identity),
+    ("patient_name", DICOM_TAGS["PatientName"], _person_name),
+    ("birth_date", DICOM_TAGS["PatientBirthDate"], parse_dicom_date),
+    ("sex", DICOM_TAGS["PatientSex"], _identity),
+)
+
+_PATIENT_DEFAULTS = {"patient_id": "", "patient_name": "Unknown"}
+
+_SERIES_FIELDS: tuple[tuple[str, str, Callable], ...] = (
+    ("series_number", DICOM_TAGS["SeriesNumber"], _as_int),
+    ("series_description", DICOM_TAGS["SeriesDescription"], _identity),
+    ("body_part", DICOM_TAGS["BodyPartExamined"], _identity),
+)
+
+_SERIES_DEFAULTS = {"series_number": 0}
+
+
+# Orthanc /tools/find returns plain keyword -> string maps, so no DICOM
+# JSON unwrapping or PN handling is needed.
+_ORTHANC_STUDY_FIELDS: tuple[tuple[str, str, Callable], ...] = (
+    ("study_id", "StudyID", _identity),
+    ("accession_number", "AccessionNumber", _identity),
+    ("study_date", "StudyDate", parse_dicom_date),
+    ("study_time", "StudyTime", _identity),
+    ("study_description", "StudyDescription", _identity),
+    ("referring_physician", "ReferringPhysicianName", _identity),
+    ("institution_name", "InstitutionName", _identity),
+)
+
+_ORTHANC_PATIENT_FIELDS: tuple[tuple[str, str, Callable], ...] = (
+    ("patient_id", "PatientID", _identity),
+    ("patient_name", "PatientName", _identity),
+    ("birth_date", "PatientBirthDate", parse_dicom_date),
+    ("sex", "PatientSex", _identity),
+)
+
+
+def _extract_keyword_fields(
+    tags: dict,
+    fields: tuple[tuple[str, str, Callable], ...],
+    defaults: Optional[dict] = None,
+) -> dict:
+    """Collect non-empty fields from an Orthanc keyword -> value map."""
+    out = dict(defaults) if defaults else {}
+    for name, keyword, convert in fields:
+        value = tags.get(keyword)
+        if value:
+            out[name] = convert(value)
+    return out
+
+
+def _extract_fields(
+    data: dict,
+    fields: tuple[tuple[str, str, Callable], ...],
+    defaults: Optional[dict] = None,
+) -> dict:
+    """Collect present fields from a DICOM JSON object in one pass."""
+    out = dict(defaults) if defaults else {}
+    for name, tag, convert in fields:
+        tag_data = data.get(tag)
+        if tag_data:
+            values = tag_data.get("Value")
+            if values:
+                out[name] = convert(values[0])
+    return out
+
+
+# SeriesDescription fragments identifying echo reports among several SRs
+ECHO_SR_DESCRIPTIONS = ("echo", "tte", "tee", "5100")
+
+
+def _select_echo_sr_series(series_results: list[dict]) -> Optional[str]:
+    """
+    Pick the SR series to parse for echo measurements.
+
+    Prefers a series whose description names an echo report, falling
+    back to the first SR series.
+    """
+    first_uid = None
+    for series_data in series_results:
+        series_uid = get_tag_value(series_data, "SeriesInstanceUID")
+        if not series_uid:
+            continue
+        description = (get_tag_value(series_data, "SeriesDescription") or "").lower()
+        if any(fragment in description for fragment in ECHO_SR_DESCRIPTIONS):
+            return series_uid
+        if first_uid is None:
+            first_uid = series_uid
+    return first_uid
+
+
+# Shared by all DicomService instances in this worker: after repeated
+# connection failures or timeouts, Orthanc calls fail fast instead of
+# each waiting out the timeout. HTTP status errors do not count.
+orthanc_breaker = CircuitBreaker(
+    fail_max=5,
+    reset_timeout=30,
+    exceptions=(httpx.TransportError,),
+)
+
+
+# Series thumbnails embedded by get_study(prefetch_thumbnails=True), and
+# how many of those requests may be in flight at once
+THUMBNAIL_PREFETCH_LIMIT = 12
+THUMBNAIL_PREFETCH_CONCURRENCY = 8
+
+# Upper bound for one STOW-RS request body; larger uploads are split
+STOW_MAX_BATCH_BYTES = 64 * 1024 * 1024
+
+
+def _stow_batches(instances: list[bytes], max_bytes: int) -> Iterator[list[bytes]]:
+    """Group instances into batches whose total size stays under max_bytes."""
+    batch: list[bytes] = []
+    size = 0
+    for data in instances:
+        if batch and size + len(data) > max_bytes:
+            yield batch
+            batch, size = [], 0
+        batch.append(data)
+        size += len(data)
+    if batch:
+        yield batch
+
+
+def _multipart_related(parts: list[bytes], boundary: str) -> bytes:
+    """Encode DICOM parts as a multipart/related STOW-RS body."""
+    delimiter = f"--{boundary}\r\nContent-Type: application/dicom\r\n\r\n".encode()
+    chunks: list[bytes] = []
+    for data in parts:
+        chunks += (delimiter, data, b"\r\n")
+    chunks.append(f"--{boundary}--\r\n".encode())
+    return b"".join(chunks)
+
+
+# Chunk size when relaying binary Orthanc responses (thumbnails)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_response(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Relay a streamed response body, closing it when done or abandoned."""
     try:
-        return datetime.strptime(date_str, "%Y%m%d").date()
-    except ValueError:
-        return None
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+def create_orthanc_client() -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used for all Orthanc calls.
+
+    Owned by the application-wide DicomService so that keep-alive
+    connections are reused across requests instead of paying a TCP
+    handshake on every QIDO/WADO call.
+    """
+    return httpx.AsyncClient(
+        auth=(
+            getattr(settings, "orthanc_username", "orthanc"),
+            getattr(settings, "orthanc_password", "orthanc"),
+        ),
+        # Fail fast on an unreachable host; bulk transfers override per call
+        timeout=httpx.Timeout(10.0, connect=1.0),
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
 
 
 class DicomService:
@@ -98,68 +366,134 @@ class DicomService:
     DICOMweb client for Orthanc PACS server.
 
     Provides methods to query, retrieve, and manage DICOM studies.
-    Uses async httpx for non-blocking HTTP requests.
+    Uses a long-lived async httpx client so Orthanc connections are
+    pooled; one instance is created per application (see main.lifespan)
+    and closed on shutdown. Parsed study metadata is kept for a short
+    TTL since opening a study fires several calls for the same UID.
     """
 
-    def __init__(self):
-        """Initialize DICOM service with Orthanc configuration."""
+    STUDY_CACHE_SIZE = 512
+    STUDY_CACHE_TTL_SECONDS = 60
+    ORTHANC_ID_CACHE_SIZE = 1024
+    ORTHANC_ID_CACHE_TTL_SECONDS = 3600
+
+    # DICOMweb paths (relative to dicomweb_url), filled with a single %
+    _PATH_STUDIES = "/studies"
+    _PATH_STUDY_SERIES = "/studies/%s/series"
+    _PATH_SERIES_METADATA = "/studies/%s/series/%s/metadata"
+    _PATH_SERIES_THUMBNAIL = "/studies/%s/series/%s/thumbnail"
+
+    # Orthanc REST paths (relative to orthanc_url)
+    _PATH_ORTHANC_FIND = "/tools/find"
+    _PATH_ORTHANC_LOOKUP = "/tools/lookup"
+    _PATH_ORTHANC_STUDY = "/studies/%s"
+    _PATH_ORTHANC_SYSTEM = "/system"
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        use_orthanc_native: Optional[bool] = None,
+    ):
+        """
+        Initialize DICOM service with Orthanc configuration.
+
+        Args:
+            client: Orthanc HTTP client; defaults to create_orthanc_client()
+            use_orthanc_native: Search via Orthanc's /tools/find instead of
+                QIDO-RS; defaults to settings.orthanc_native_search
+        """
+        self.client = client or create_orthanc_client()
+        if use_orthanc_native is None:
+            use_orthanc_native = getattr(settings, "orthanc_native_search", True)
+        self.use_orthanc_native = use_orthanc_native
+        # Set once /tools/find has answered a search successfully
+        self._tools_find_verified = False
         self.orthanc_url = getattr(settings, "orthanc_url", "http://orthanc:8042")
-        self.orthanc_username = getattr(settings, "orthanc_username", "orthanc")
-        self.orthanc_password = getattr(settings, "orthanc_password", "orthanc")
         self.ohif_url = getattr(settings, "ohif_url", "http://localhost:3001")
         self.dicomweb_url = f"{self.orthanc_url}/dicom-web"
+        self._study_cache: TTLCache[str, DicomStudy] = TTLCache(
+            maxsize=self.STUDY_CACHE_SIZE, ttl=self.STUDY_CACHE_TTL_SECONDS
+        )
+        self._orthanc_ids: TTLCache[str, str] = TTLCache(
+            maxsize=self.ORTHANC_ID_CACHE_SIZE, ttl=self.ORTHANC_ID_CACHE_TTL_SECONDS
+        )
+
+    def invalidate(self, study_uid: str) -> None:
+        """Drop cached metadata for a study after it changes in Orthanc."""
+        self._study_cache.pop(study_uid)
 
-    def _get_auth(self) -> tuple[str, str]:
-        """Get Basic Auth credentials for Orthanc."""
-        return (self.orthanc_username, self.orthanc_password)
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
 
     async def _request(
         self,
         method: str,
         path: str,
-        params: Optional[dict] = None,
+        params: Optional[dict | list[tuple[str, str]]] = None,
         json_data: Optional[dict] = None,
         accept: str = "application/dicom+json",
+        timeout: Optional[float] = None,
+        root: Optional[str] = None,
     ) -> dict | list:
         """
         Make HTTP request to Orthanc DICOMweb API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
-            path: API path (relative to DICOMweb root)
+            path: API path relative to the DICOMweb root, with leading slash
             params: Query parameters
             json_data: JSON body for POST requests
             accept: Accept header value
+            timeout: Per-call timeout override (defaults to the client's)
+            root: URL root to resolve path against (defaults to dicomweb_url;
+                pass orthanc_url for the native REST API)
 
         Returns:
-            Parsed JSON response
+            Parsed JSON response (decoded with orjson; Orthanc metadata
+            payloads are large enough for the stdlib parser to dominate)
 
         Raises:
-            httpx.HTTPError: On connection or HTTP errors
+            httpx.HTTPError: On connection or HTTP errors, including when
+                the Orthanc circuit breaker is open
         """
-        url = f"{self.dicomweb_url}/{path.lstrip('/')}"
+        url = (root or self.dicomweb_url) + path
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                auth=self._get_auth(),
-                headers={"Accept": accept},
-            )
-            response.raise_for_status()
+        try:
+            async with orthanc_breaker:
+                response = await self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers={"Accept": accept},
+                    timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                )
+        except CircuitOpenError as e:
+            raise httpx.ConnectError("Orthanc unavailable (circuit open)") from e
+        response.raise_for_status()
 
-            if response.content:
-                return response.json()
-            return {}
+        content = response.content
+        if content:
+            return orjson.loads(content)
+        return {}
 
     async def search_studies(
         self,
         request: StudySearchRequest,
     ) -> DicomStudyList:
         """
-        Search for DICOM studies using QIDO-RS.
+        Search for DICOM studies.
+
+        Uses Orthanc's native /tools/find when use_orthanc_native is set,
+        falling back to QIDO-RS (for good) if Orthanc lacks it. With
+        QIDO-RS only the list-view attributes (QIDO_STUDY_LIST_FIELDS) are
+        requested; use get_study for time, referring physician,
+        institution and patient birth date/sex.
+
+        Cursor pages cap StudyDate at the previous page's last date and
+        skip the studies on it already returned (see StudyCursor), so deep
+        scans stay cheap without dropping same-day studies.
 
         Args:
             request: Search parameters
@@ -167,73 +501,174 @@ class DicomService:
         Returns:
             Paginated list of matching studies
         """
-        # Build QIDO-RS query parameters
-        params = {
-            "limit": request.per_page,
-            "offset": (request.page - 1) * request.per_page,
-            # Request these fields in response
-            "includefield": ",".join([
-                "00080020",  # StudyDate
-                "00080030",  # StudyTime
-                "00081030",  # StudyDescription
-                "00080050",  # AccessionNumber
-                "00080060",  # ModalitiesInStudy
-                "00100010",  # PatientName
-                "00100020",  # PatientID
-                "00100030",  # PatientBirthDate
-                "00100040",  # PatientSex
-                "00080090",  # ReferringPhysician
-                "00080080",  # InstitutionName
-                "00201206",  # NumberOfStudyRelatedSeries
-                "00201208",  # NumberOfStudyRelatedInstances
-            ]),
-        }
-
-        # Add search filters
-        if request.patient_id:
-            params["PatientID"] = request.patient_id
-        if request.patient_name:
-            params["PatientName"] = f"*{request.patient_name}*"
-        if request.accession_number:
-            params["AccessionNumber"] = request.accession_number
-        if request.study_description:
-            params["StudyDescription"] = f"*{request.study_description}*"
-        if request.modality:
-            params["ModalitiesInStudy"] = request.modality.value
-
-        # Date range filter (DICOM format: YYYYMMDD-YYYYMMDD)
-        if request.study_date_from or request.study_date_to:
-            date_from = request.study_date_from.strftime("%Y%m%d") if request.study_date_from else ""
-            date_to = request.study_date_to.strftime("%Y%m%d") if request.study_date_to else ""
-            params["StudyDate"] = f"{date_from}-{date_to}"
+        per_page = request.per_page
+        after = request.after
+        capped = after is not None and bool(after.study_date)
+        if after is None:
+            offset = start = (request.page - 1) * per_page
+        elif capped:
+            # to_qido_params caps StudyDate at the cursor's date, so only the
+            # studies already returned on that date need skipping.
+            offset, start = after.skip, after.seen
+        else:
+            offset = start = after.seen
 
         try:
-            results = await self._request("GET", "/studies", params=params)
+            # One row past the page tells us whether another page exists
+            # without a separate count query.
+            window = await self._find_studies(request, offset, per_page + 1)
+            has_next = len(window) > per_page
+            window = window[:per_page]
+            if capped and not has_next and not (
+                request.study_date_from or request.study_date_to
+            ):
+                # The dated studies are exhausted, but undated ones (which
+                # no StudyDate range matches and which sort last) may remain.
+                remaining = per_page - len(window)
+                rest = await self._find_studies(
+                    replace(request, after=None), start + len(window), remaining + 1
+                )
+                has_next = len(rest) > remaining
+                window += rest[:remaining]
         except httpx.HTTPError as e:
             logger.error(f"DICOM search failed: {e}")
             return DicomStudyList(
                 studies=[],
                 total=0,
                 page=request.page,
-                per_page=request.per_page,
+                per_page=per_page,
             )
 
-        # Parse results
-        studies = []
-        for study_data in results:
-            study = self._parse_study(study_data)
-            if study:
-                studies.append(study)
-
-        # Note: QIDO-RS doesn't always return total count
-        # In production, you might need a separate count query
-        total = len(studies) if len(studies) < request.per_page else request.page * request.per_page + 1
+        studies = [study for study in window if study]
+        next_cursor = None
+        if has_next:
+            next_cursor = _next_study_cursor(window, after, start).encode()
 
         return DicomStudyList(
             studies=studies,
-            total=total,
+            # Exact only once the final page of an offset scan is reached
+            total=start + len(studies) if not has_next and after is None else None,
             page=request.page,
-            per_page=request.per_page,
+            per_page=per_page,
+            has_next=has_next,
+            next_cursor=next_cursor,
+        )
+
+    async def _find_studies(
+        self,
+        request: StudySearchRequest,
+        offset: int,
+        limit: int,
+    ) -> list[Optional[DicomStudy]]:
+        """
+        Fetch one window of a study search, None for unparseable rows.
+
+        Tries /tools/find when use_orthanc_native is set and switches to
+        QIDO-RS for good if the endpoint does not exist, or answers 400
+        before it has ever succeeded (Orthanc older than 1.12.5 rejects
+        OrderBy). Other errors (auth, a rejected query) fail only this call.
+        """
+        if self.use_orthanc_native:
+            try:
+                results = await self._tools_find(request, offset, limit)
+                self._tools_find_verified = True
+                return [self._parse_orthanc_study(row) for row in results]
+            except httpx.HTTPStatusError as e:
+                code = e.response.status_code
+                if code not in _TOOLS_FIND_UNSUPPORTED and not (
+                    code == 400 and not self._tools_find_verified
+                ):
+                    raise
+                # Older Orthanc or a non-Orthanc PACS: stick to QIDO-RS
+                logger.warning(f"Orthanc /tools/find unavailable, using QIDO-RS: {e}")
+                self.use_orthanc_native = False
+        results = await self._qido_search(request, offset, limit)
+        return [self._parse_study(row) for row in results]
+
+    async def _qido_search(
+        self,
+        request: StudySearchRequest,
+        offset: int,
+        limit: int,
+    ) -> list:
+        """Run a study search through QIDO-RS."""
+        params = request.to_qido_params()
+        params += [
+            ("orderby", QIDO_STUDY_ORDER),
+            ("offset", str(offset)),
+            ("limit", str(limit)),
+            ("includefield", QIDO_STUDY_LIST_FIELDS),
+        ]
+        return await self._request("GET", self._PATH_STUDIES, params=params)
+
+    async def _tools_find(
+        self,
+        request: StudySearchRequest,
+        offset: int,
+        limit: int,
+    ) -> list:
+        """
+        Run a study search through Orthanc's native /tools/find.
+
+        Answers straight from Orthanc's main-tags database index without
+        the DICOM JSON envelope (or the dicom-as-json reads it can imply),
+        so it is cheaper than QIDO-RS on Orthanc. The QIDO filter pairs
+        use DICOM keywords, which /tools/find accepts unchanged.
+        """
+        query = {
+            "Level": "Study",
+            "Query": dict(request.to_qido_params()),
+            "Expand": True,
+            "RequestedTags": ["ModalitiesInStudy"],
+            "OrderBy": ORTHANC_STUDY_ORDER,
+            "Limit": limit,
+        }
+        if offset:
+            query["Since"] = offset
+        return await self._request(
+            "POST",
+            self._PATH_ORTHANC_FIND,
+            json_data=query,
+            accept="application/json",
+            root=self.orthanc_url,
+        )
+
+    def _parse_orthanc_study(self, data: dict) -> Optional[DicomStudy]:
+        """Parse an expanded /tools/find study into DicomStudy."""
+        tags = data.get("MainDicomTags", {})
+        study_uid = tags.get("StudyInstanceUID")
+        if not study_uid:
+            return None
+
+        # Remember the resource ID so a later delete skips /tools/lookup
+        if orthanc_id := data.get("ID"):
+            self._orthanc_ids[study_uid] = orthanc_id
+
+        requested = data.get("RequestedTags", {})
+        modalities = [
+            modality
+            for modality in map(
+                MODALITY_BY_CODE.get,
+                (requested.get("ModalitiesInStudy") or "").split("\\"),
+            )
+            if modality is not None
+        ]
+
+        patient = DicomPatient(
+            **_extract_keyword_fields(
+                data.get("PatientMainDicomTags", {}),
+                _ORTHANC_PATIENT_FIELDS,
+                _PATIENT_DEFAULTS,
+            )
+        )
+
+        return DicomStudy(
+            study_instance_uid=study_uid,
+            patient=patient,
+            modalities=modalities,
+            series_count=len(data.get("Series", ())),
+            status=StudyStatus.NEW,
+            **_extract_keyword_fields(tags, _ORTHANC_STUDY_FIELDS),
         )
 
     def _parse_study(self, data: dict) -> Optional[DicomStudy]:
@@ -244,106 +679,135 @@ class DicomService:
 
         # Parse modalities (may be a list)
         modalities_raw = data.get(DICOM_TAGS["Modality"], {}).get("Value", [])
-        modalities = []
-        for mod in modalities_raw:
-            try:
-                modalities.append(Modality(mod))
-            except ValueError:
-                pass
+        modalities = [
+            modality
+            for modality in map(MODALITY_BY_CODE.get, modalities_raw)
+            if modality is not None
+        ]
 
         # Parse patient info
         patient = DicomPatient(
-            patient_id=get_tag_value(data, "PatientID", ""),
-            patient_name=get_tag_value(data, "PatientName", "Unknown"),
-            birth_date=parse_dicom_date(get_tag_value(data, "PatientBirthDate")),
-            sex=get_tag_value(data, "PatientSex"),
+            **_extract_fields(data, _PATIENT_FIELDS, _PATIENT_DEFAULTS)
         )
 
         return DicomStudy(
             study_instance_uid=study_uid,
-            study_id=get_tag_value(data, "StudyID"),
-            accession_number=get_tag_value(data, "AccessionNumber"),
-            study_date=parse_dicom_date(get_tag_value(data, "StudyDate")),
-            study_time=get_tag_value(data, "StudyTime"),
-            study_description=get_tag_value(data, "StudyDescription"),
-            referring_physician=get_tag_value(data, "ReferringPhysicianName"),
-            institution_name=get_tag_value(data, "InstitutionName"),
             patient=patient,
             modalities=modalities,
-            series_count=int(get_tag_value(data, "NumberOfStudyRelatedSeries", 0) or 0),
             status=StudyStatus.NEW,
+            **_extract_fields(data, _STUDY_FIELDS),
         )
 
-    async def get_study(self, study_uid: str) -> Optional[DicomStudy]:
+    async def get_study(
+        self, study_uid: str, prefetch_thumbnails: bool = False
+    ) -> Optional[DicomStudy]:
         """
         Get detailed study metadata including series.
 
         Args:
             study_uid: Study Instance UID
+            prefetch_thumbnails: Also fetch the first series' thumbnails
+                concurrently and embed them, so a study page renders
+                without one follow-up request per series
 
         Returns:
             DicomStudy with series details, or None if not found
         """
-        try:
-            # Get study metadata
-            studies = await self._request(
-                "GET",
-                f"/studies/{study_uid}/metadata",
-            )
-
-            if not studies:
+        study = self._study_cache.get(study_uid)
+        if study is None:
+            study = await self._fetch_study(study_uid)
+            if study is None:
                 return None
-
-            # Get study-level info
-            study_results = await self._request(
-                "GET",
-                "/studies",
-                params={"StudyInstanceUID": study_uid},
+            self._study_cache[study_uid] = study
+
+        if prefetch_thumbnails and study.series:
+            return await self._with_series_thumbnails(study)
+        return study
+
+    async def _with_series_thumbnails(self, study: DicomStudy) -> DicomStudy:
+        """Copy of study with base64 thumbnails on its first series."""
+        semaphore = asyncio.Semaphore(THUMBNAIL_PREFETCH_CONCURRENCY)
+        prefetched = study.series[:THUMBNAIL_PREFETCH_LIMIT]
+
+        async def fetch(series: DicomSeries) -> Optional[bytes]:
+            async with semaphore:
+                try:
+                    return await self.get_series_thumbnail(
+                        study.study_instance_uid, series.series_instance_uid
+                    )
+                except httpx.HTTPError as e:
+                    logger.warning(
+                        f"Failed to prefetch thumbnail for series "
+                        f"{series.series_instance_uid}: {e}"
+                    )
+                    return None
+
+        thumbnails = await asyncio.gather(*map(fetch, prefetched))
+        series_list = [
+            series.model_copy(
+                update={"thumbnail": base64.b64encode(thumbnail).decode()}
             )
-
-            if not study_results:
-                return None
-
-            study = self._parse_study(study_results[0])
-            if not study:
-                return None
-
-            # Get series for this study
-            series_results = await self._request(
+            if thumbnail
+            else series
+            for series, thumbnail in zip(prefetched, thumbnails)
+        ]
+        series_list += study.series[THUMBNAIL_PREFETCH_LIMIT:]
+        return study.model_copy(update={"series": series_list})
+
+    async def _fetch_study(self, study_uid: str) -> Optional[DicomStudy]:
+        """Load a study and its series from Orthanc."""
+        # Study-level QIDO row and series list are independent, so fetch
+        # them concurrently over the shared connection pool (~1 RTT
+        # instead of 2). The QIDO row doubles as the existence check.
+        study_results, series_results = await asyncio.gather(
+            self._request(
                 "GET",
-                f"/studies/{study_uid}/series",
-            )
-
-            for series_data in series_results:
-                series = self._parse_series(series_data)
-                if series:
-                    study.series.append(series)
+                self._PATH_STUDIES,
+                params={
+                    "StudyInstanceUID": study_uid,
+                    "includefield": QIDO_STUDY_DETAIL_FIELDS,
+                },
+            ),
+            self._request("GET", self._PATH_STUDY_SERIES % study_uid),
+            return_exceptions=True,
+        )
+        for result in (study_results, series_results):
+            if isinstance(result, httpx.HTTPError):
+                logger.error(f"Failed to get study {study_uid}: {result}")
+                return None
+            if isinstance(result, BaseException):
+                raise result
 
-            return study
+        if not study_results:
+            return None
 
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to get study {study_uid}: {e}")
+        study = self._parse_study(study_results[0])
+        if not study:
             return None
 
+        series_list = [
+            series
+            for series in map(self._parse_series, series_results)
+            if series
+        ]
+        return study.model_copy(update={"series": series_list})
+
     def _parse_series(self, data: dict) -> Optional[DicomSeries]:
         """Parse DICOM JSON series response."""
         series_uid = get_tag_value(data, "SeriesInstanceUID")
         if not series_uid:
             return None
 
-        modality_str = get_tag_value(data, "Modality", "OT")
-        try:
-            modality = Modality(modality_str)
-        except ValueError:
-            modality = Modality.SR  # Default to SR for unknown
+        modality = MODALITY_BY_CODE.get(
+            get_tag_value(data, "Modality", "OT"),
+            Modality.SR,  # Default to SR for unknown
+        )
 
         return DicomSeries(
             series_instance_uid=series_uid,
-            series_number=int(get_tag_value(data, "SeriesNumber", 0) or 0),
-            series_description=get_tag_value(data, "SeriesDescription"),
             modality=modality,
-            body_part=get_tag_value(data, "BodyPartExamined"),
             instance_count=0,  # Would need separate query
+            **_extract_fields(data, _SERIES_FIELDS, _SERIES_DEFAULTS),
         )
 
     async def get_viewer_url(self, study_uid: str) -> ViewerUrlResponse:
@@ -367,52 +831,93 @@ class DicomService:
             study_instance_uid=study_uid,
         )
 
-    async def get_study_thumbnail(self, study_uid: str) -> Optional[bytes]:
+    async def _first_series_uid(self, study_uid: str) -> Optional[str]:
         """
-        Get thumbnail image for study preview.
+        Resolve the series whose thumbnail represents a study.
+
+        Uses the cached study when available, otherwise asks Orthanc
+        for just the first series UID.
+
+        Raises:
+            httpx.HTTPError: On connection or HTTP errors
+        """
+        cached = self._study_cache.get(study_uid)
+        if cached is not None and cached.series:
+            return cached.series[0].series_instance_uid
+
+        series_results = await self._request(
+            "GET",
+            self._PATH_STUDY_SERIES % study_uid,
+            params={"limit": 1, "includefield": DICOM_TAGS["SeriesInstanceUID"]},
+        )
+        if not series_results:
+            return None
+        return get_tag_value(series_results[0], "SeriesInstanceUID")
+
+    async def get_series_thumbnail(self, study_uid: str, series_uid: str) -> bytes:
+        """
+        Fetch the WADO-RS rendered JPEG thumbnail of one series.
+
+        Raises:
+            httpx.HTTPError: On connection or HTTP errors
+        """
+        response = await self.client.get(
+            self.dicomweb_url + self._PATH_SERIES_THUMBNAIL % (study_uid, series_uid),
+            headers={"Accept": "image/jpeg"},
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        return response.content
+
+    async def stream_study_thumbnail(
+        self, study_uid: str
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Stream the thumbnail image for study preview.
+
+        The JPEG is relayed in chunks as Orthanc sends it rather than
+        buffered whole. The Orthanc status
+        is checked before returning, so a missing thumbnail is reported
+        as None instead of failing mid-stream.
 
         Args:
             study_uid: Study Instance UID
 
         Returns:
-            JPEG thumbnail bytes or None
+            Async iterator of JPEG bytes, or None if unavailable
         """
         try:
-            # Get first series
-            series_results = await self._request(
-                "GET",
-                f"/studies/{study_uid}/series",
-            )
-
-            if not series_results:
-                return None
-
-            series_uid = get_tag_value(series_results[0], "SeriesInstanceUID")
+            series_uid = await self._first_series_uid(study_uid)
             if not series_uid:
                 return None
 
-            # Get thumbnail via WADO-RS
-            url = f"{self.dicomweb_url}/studies/{study_uid}/series/{series_uid}/thumbnail"
-
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    url,
-                    auth=self._get_auth(),
-                    headers={"Accept": "image/jpeg"},
-                )
-                response.raise_for_status()
-                return response.content
-
+            request = self.client.build_request(
+                "GET",
+                self.dicomweb_url
+                + self._PATH_SERIES_THUMBNAIL % (study_uid, series_uid),
+                headers={"Accept": "image/jpeg"},
+                timeout=10.0,
+            )
+            response = await self.client.send(request, stream=True)
         except httpx.HTTPError as e:
             logger.warning(f"Failed to get thumbnail for {study_uid}: {e}")
             return None
 
+        if response.is_error:
+            await response.aclose()
+            logger.warning(
+                f"Failed to get thumbnail for {study_uid}: HTTP {response.status_code}"
+            )
+            return None
+        return _iter_response(response)
+
     async def get_echo_measurements(self, study_uid: str) -> Optional[EchoMeasurements]:
         """
         Extract Echo measurements from DICOM Structured Report.
 
-        Fetches the SR instance via WADO-RS and parses it using pydicom
-        to extract quantitative measurements following TID 5100 template.
+        Finds SR series with a single QIDO-RS query, fetches the series
+        metadata via WADO-RS and parses it using pydicom to extract
+        quantitative measurements following TID 5100 template.
 
         Args:
             study_uid: Study Instance UID
@@ -421,52 +926,36 @@ class DicomService:
             EchoMeasurements if SR found and parsed, None otherwise
         """
         try:
-            # Find SR series in the study
-            series_results = await self._request(
+            # Only SR series are needed; let Orthanc filter them
+            sr_series_results = await self._request(
                 "GET",
-                f"/studies/{study_uid}/series",
+                self._PATH_STUDY_SERIES % study_uid,
+                params={
+                    "Modality": "SR",
+                    "includefield": DICOM_TAGS["SeriesDescription"],
+                },
             )
 
-            sr_series = None
-            for series_data in series_results:
-                modality = get_tag_value(series_data, "Modality")
-                if modality == "SR":
-                    sr_series = get_tag_value(series_data, "SeriesInstanceUID")
-                    break
-
+            sr_series = _select_echo_sr_series(sr_series_results)
             if not sr_series:
                 logger.info(f"No SR series found for study {study_uid}")
                 return None
 
-            # Get SR instances
-            instances = await self._request(
+            # Series-level metadata returns every instance's full DICOM JSON
+            # in one call, so no instance listing or P10 download is needed
+            metadata = await self._request(
                 "GET",
-                f"/studies/{study_uid}/series/{sr_series}/instances",
+                self._PATH_SERIES_METADATA % (study_uid, sr_series),
+                timeout=60.0,
             )
 
-            if not instances:
+            if not metadata:
                 return None
 
-            # Get the first SR instance UID
-            instance_uid = get_tag_value(instances[0], "SOPInstanceUID")
-            if not instance_uid:
-                return None
-
-            # Fetch raw DICOM SR via WADO-RS
-            from io import BytesIO
-            import pydicom
-
-            wado_url = f"{self.base_url}/studies/{study_uid}/series/{sr_series}/instances/{instance_uid}"
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    wado_url,
-                    auth=self._get_auth(),
-                    headers={"Accept": "application/dicom"},
-                )
-                response.raise_for_status()
+            from pydicom import Dataset
 
-            # Parse the DICOM dataset
-            ds = pydicom.dcmread(BytesIO(response.content))
+            # Parse the first SR instance's DICOM JSON into a dataset
+            ds = Dataset.from_json(metadata[0])
 
             # Extract measurements using SR parser
             from app.integrations.dicom.sr_parser import parse_sr_dataset
@@ -498,27 +987,56 @@ class DicomService:
         Returns:
             SOPInstanceUID if successful, None otherwise
         """
-        try:
-            url = f"{self.dicomweb_url}/studies"
+        stored = await self.store_instances([dicom_data])
+        return stored[0] if stored else None
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    url,
-                    content=dicom_data,
-                    auth=self._get_auth(),
+    async def store_instances(self, instances: list[bytes]) -> list[str]:
+        """
+        Store DICOM instances via STOW-RS, many per request.
+
+        Instances are packed into multipart/related bodies of up to
+        STOW_MAX_BATCH_BYTES, so importing a whole series costs a few
+        POSTs over pooled connections instead of one per instance. A
+        failed batch is logged and skipped; the others still upload.
+
+        Args:
+            instances: Raw DICOM P10 file bytes, one entry per instance
+
+        Returns:
+            SOPInstanceUIDs Orthanc reported as stored
+        """
+        stored: list[str] = []
+        for batch in _stow_batches(instances, STOW_MAX_BATCH_BYTES):
+            boundary = uuid.uuid4().hex
+            try:
+                response = await self.client.post(
+                    self.dicomweb_url + self._PATH_STUDIES,
+                    content=_multipart_related(batch, boundary),
                     headers={
-                        "Content-Type": "application/dicom",
+                        "Content-Type": (
+                            'multipart/related; type="application/dicom"; '
+                            f"boundary={boundary}"
+                        ),
                         "Accept": "application/dicom+json",
                     },
+                    timeout=60.0,
                 )
                 response.raise_for_status()
-                # Parse response for stored instance UID
-                result = response.json()
-                return result.get("00081199", {}).get("Value", [{}])[0].get("00081155", {}).get("Value", [None])[0]
-
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to store DICOM instance: {e}")
-            return None
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to store {len(batch)} DICOM instance(s): {e}")
+                continue
+
+            # Parse the ReferencedSOPSequence for stored instance UIDs
+            result = orjson.loads(response.content) if response.content else {}
+            for referenced in result.get("00081199", {}).get("Value", []):
+                sop_uid = get_tag_value(referenced, "00081155")
+                if sop_uid:
+                    stored.append(sop_uid)
+
+        if stored:
+            # The new instances may belong to any cached study
+            self._study_cache.clear()
+        return stored
 
     async def delete_study(self, study_uid: str) -> bool:
         """
@@ -533,33 +1051,73 @@ class DicomService:
             True if deleted successfully
         """
         try:
-            # Orthanc uses its own resource IDs, need to look up first
-            url = f"{self.orthanc_url}/tools/lookup"
-
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    url,
-                    data=study_uid,
-                    auth=self._get_auth(),
-                )
-                response.raise_for_status()
-                resources = response.json()
-
-                if not resources:
-                    return False
-
-                # Delete by Orthanc ID
-                orthanc_id = resources[0]["ID"]
-                delete_response = await client.delete(
-                    f"{self.orthanc_url}/studies/{orthanc_id}",
-                    auth=self._get_auth(),
-                )
-                delete_response.raise_for_status()
-                return True
+            orthanc_id = await self._resolve_orthanc_id(study_uid)
+            if not orthanc_id:
+                return False
+
+            # Delete by Orthanc ID
+            delete_response = await self.client.delete(
+                self.orthanc_url + self._PATH_ORTHANC_STUDY % orthanc_id,
+                timeout=10.0,
+            )
+            delete_response.raise_for_status()
+            self.invalidate(study_uid)
+            return True
 
         except httpx.HTTPError as e:
             logger.error(f"Failed to delete study {study_uid}: {e}")
             return False
+        finally:
+            # The study is gone (or the cached ID was stale); either way
+            # the next operation on this UID must look it up again
+            self._orthanc_ids.pop(study_uid)
+
+    async def _resolve_orthanc_id(self, study_uid: str) -> Optional[str]:
+        """
+        Map a StudyInstanceUID to Orthanc's resource ID.
+
+        Orthanc's REST API addresses resources by its own IDs. The
+        mapping is stable for the life of a study, so it is cached
+        (and pre-filled by /tools/find searches) to spare a
+        /tools/lookup round trip on repeat and bulk operations.
+
+        Raises:
+            httpx.HTTPError: On connection or HTTP errors
+        """
+        orthanc_id = self._orthanc_ids.get(study_uid)
+        if orthanc_id is not None:
+            return orthanc_id
+
+        response = await self.client.post(
+            self.orthanc_url + self._PATH_ORTHANC_LOOKUP,
+            content=study_uid,
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        resources = orjson.loads(response.content)
+
+        for resource in resources:
+            if resource.get("Type") == "Study":
+                orthanc_id = resource["ID"]
+                self._orthanc_ids[study_uid] = orthanc_id
+                return orthanc_id
+        return None
+
+    async def ping(self) -> bool:
+        """
+        Probe Orthanc's /system endpoint.
+
+        Returns:
+            True if Orthanc answered 200
+
+        Raises:
+            httpx.HTTPError: If Orthanc cannot be reached
+        """
+        response = await self.client.get(
+            self.orthanc_url + self._PATH_ORTHANC_SYSTEM,
+            timeout=5.0,
+        )
+        return response.status_code == 200
 
     async def check_connection(self) -> bool:
         """
@@ -569,12 +1127,6 @@ class DicomService:
             True if Orthanc is reachable
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.orthanc_url}/system",
-                    auth=self._get_auth(),
-                )
-                response.raise_for_status()
-                return True
+            return await self.ping()
         except httpx.HTTPError:
             return False
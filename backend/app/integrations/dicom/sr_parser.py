@@ -14,7 +14,7 @@ Graceful handling: unrecognized fields return None, never raises.
 """
 
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 from app.integrations.dicom.schemas import (
     DiastolicFunction,
@@ -22,6 +22,7 @@ from app.integrations.dicom.schemas import (
     LAMeasurements,
     LVMeasurements,
     RVMeasurements,
+    parse_dicom_date,
 )
 
 logger = logging.getLogger(__name__)
@@ -116,14 +117,22 @@ CONCEPT_MAP: dict[tuple[str, str], str] = {
     ("SCT", "399065007"): "la.la_volume_index",
 }
 
+# Two-level view of CONCEPT_MAP (scheme -> code -> field path) used by the
+# traversal hot loop, so each NUM item is matched without building a
+# (scheme, code) tuple key.
+_CONCEPTS_BY_SCHEME: dict[str, dict[str, str]] = {}
+for (_scheme, _code), _field_path in CONCEPT_MAP.items():
+    _CONCEPTS_BY_SCHEME.setdefault(_scheme, {})[_code] = _field_path
+del _scheme, _code, _field_path
+
 # Units that indicate the value is in centimeters (needs *10 for mm)
-CM_UNITS = {"cm", "centimeter", "centimeters"}
+CM_UNITS = frozenset({"cm", "centimeter", "centimeters"})
 
 # Measurement fields that should be stored in mm but may arrive in cm
-MM_FIELDS = {
+MM_FIELDS = frozenset({
     "lv.lvidd", "lv.lvids", "lv.ivs_d", "lv.lvpw_d",
     "rv.tapse", "la.la_diameter",
-}
+})
 
 
 def parse_sr_dataset(ds) -> Optional[EchoMeasurements]:
@@ -137,15 +146,21 @@ def parse_sr_dataset(ds) -> Optional[EchoMeasurements]:
         EchoMeasurements if any measurements were extracted, None otherwise
     """
     try:
-        # Get study-level metadata
-        study_uid = str(getattr(ds, "StudyInstanceUID", ""))
+        # Get study-level metadata (UI values are already str)
+        try:
+            study_uid = ds.StudyInstanceUID
+        except AttributeError:
+            return None
         if not study_uid:
             return None
 
         measurements: dict[str, float] = {}
 
         # Get the content sequence (root of SR tree)
-        content_seq = getattr(ds, "ContentSequence", None)
+        try:
+            content_seq = ds.ContentSequence
+        except AttributeError:
+            content_seq = None
         if content_seq:
             _traverse_content_tree(content_seq, measurements)
 
@@ -165,28 +180,52 @@ def _traverse_content_tree(
     measurements: dict[str, float],
 ) -> None:
     """
-    Recursively traverse SR content sequence to extract NUM items.
+    Walk the SR content sequence depth-first to extract NUM items.
 
     DICOM SR content trees are nested sequences of items, each with:
     - ValueType: CONTAINER, NUM, TEXT, CODE, etc.
     - ConceptNameCodeSequence: identifies what the item represents
     - ContentSequence: nested children (for CONTAINERs)
+
+    Uses an explicit stack of iterators rather than recursion, so deeply
+    nested vendor reports cannot hit the recursion limit. Items are
+    visited in document order, as a recursive walk would.
+
+    Unit conversion is deferred until the walk ends: reports often
+    repeat a concept many times (per-segment or per-beat values) and
+    only the last value of each dimension field needs its units read.
     """
-    for item in items:
-        value_type = str(getattr(item, "ValueType", ""))
+    unit_items: dict[str, Any] = {}
+    stack = [iter(items)]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+
+        try:
+            value_type = item.ValueType
+        except AttributeError:
+            continue
 
         if value_type == "NUM":
-            _extract_numeric_measurement(item, measurements)
+            _extract_numeric_measurement(item, measurements, unit_items)
         elif value_type == "CONTAINER":
-            # Recurse into nested content
-            nested = getattr(item, "ContentSequence", None)
+            # Descend into nested content before the next sibling
+            try:
+                nested = item.ContentSequence
+            except AttributeError:
+                continue
             if nested:
-                _traverse_content_tree(nested, measurements)
+                stack.append(iter(nested))
+
+    _convert_cm_fields(measurements, unit_items)
 
 
 def _extract_numeric_measurement(
     item,
     measurements: dict[str, float],
+    unit_items: dict[str, Any],
 ) -> None:
     """
     Extract a numeric measurement from a NUM content item.
@@ -194,54 +233,68 @@ def _extract_numeric_measurement(
     A NUM item contains:
     - ConceptNameCodeSequence: what is being measured
     - MeasuredValueSequence: the numeric value and units
+
+    Dimension fields record their MeasuredValueSequence item in
+    unit_items for _convert_cm_fields to inspect once traversal ends.
     """
-    # Get concept code to identify the measurement
-    concept_seq = getattr(item, "ConceptNameCodeSequence", None)
-    if not concept_seq or not concept_seq[0]:
+    # Get concept code to identify the measurement. Attributes are read
+    # directly: pydicom raises AttributeError for absent keywords and
+    # IndexError for empty sequences, which is cheaper than getattr
+    # defaults on every item.
+    try:
+        concept = item.ConceptNameCodeSequence[0]
+        scheme = concept.CodingSchemeDesignator
+        code_value = concept.CodeValue
+    except (AttributeError, IndexError):
         return
 
-    concept = concept_seq[0]
-    scheme = str(getattr(concept, "CodingSchemeDesignator", ""))
-    code_value = str(getattr(concept, "CodeValue", ""))
+    scheme_concepts = _CONCEPTS_BY_SCHEME.get(scheme)
+    if not scheme_concepts:
+        return
 
     # Look up the field path for this concept code
-    field_path = CONCEPT_MAP.get((scheme, code_value))
+    field_path = scheme_concepts.get(code_value)
     if not field_path:
         return
 
     # Extract the numeric value
-    measured_seq = getattr(item, "MeasuredValueSequence", None)
-    if not measured_seq or not measured_seq[0]:
+    try:
+        measured = item.MeasuredValueSequence[0]
+    except (AttributeError, IndexError):
         # Some vendors put value directly in NumericValue
-        numeric_val = getattr(item, "NumericValue", None)
-        if numeric_val is not None:
-            try:
-                value = float(str(numeric_val))
-                measurements[field_path] = value
-            except (ValueError, TypeError):
-                pass
-        return
-
-    measured = measured_seq[0]
-    numeric_value = getattr(measured, "NumericValue", None)
-    if numeric_value is None:
+        try:
+            measurements[field_path] = float(item.NumericValue)
+        except (AttributeError, ValueError, TypeError):
+            return
+        unit_items.pop(field_path, None)
         return
 
     try:
-        value = float(str(numeric_value))
-    except (ValueError, TypeError):
+        value = float(measured.NumericValue)
+    except (AttributeError, ValueError, TypeError):
         return
 
-    # Handle unit conversions (cm -> mm for dimension fields)
-    units_seq = getattr(measured, "MeasurementUnitsCodeSequence", None)
-    if units_seq and units_seq[0]:
-        unit_code = str(getattr(units_seq[0], "CodeValue", ""))
-        unit_meaning = str(getattr(units_seq[0], "CodeMeaning", "")).lower()
+    measurements[field_path] = value
+    # Only dimension fields can need unit conversion
+    if field_path in MM_FIELDS:
+        unit_items[field_path] = measured
 
-        if field_path in MM_FIELDS and (unit_code in CM_UNITS or unit_meaning in CM_UNITS):
-            value *= 10.0  # Convert cm to mm
 
-    measurements[field_path] = value
+def _convert_cm_fields(
+    measurements: dict[str, float],
+    unit_items: dict[str, Any],
+) -> None:
+    """Convert the final value of each dimension field from cm to mm."""
+    for field_path, measured in unit_items.items():
+        try:
+            units = measured.MeasurementUnitsCodeSequence[0]
+        except (AttributeError, IndexError):
+            continue
+        unit_code = units.get("CodeValue", "")
+        unit_meaning = (units.get("CodeMeaning") or "").lower()
+
+        if unit_code in CM_UNITS or unit_meaning in CM_UNITS:
+            measurements[field_path] *= 10.0  # Convert cm to mm
 
 
 def _build_echo_measurements(
@@ -285,18 +338,7 @@ def _build_echo_measurements(
     )
 
     # Extract study date from DICOM header
-    study_date = None
-    study_date_str = str(getattr(ds, "StudyDate", ""))
-    if study_date_str and len(study_date_str) == 8:
-        try:
-            from datetime import date
-            study_date = date(
-                int(study_date_str[:4]),
-                int(study_date_str[4:6]),
-                int(study_date_str[6:8]),
-            )
-        except ValueError:
-            pass
+    study_date = parse_dicom_date(ds.get("StudyDate"))
 
     return EchoMeasurements(
         study_instance_uid=study_uid,
@@ -0,0 +1 @@
+"""Tests for DICOM integration module."""
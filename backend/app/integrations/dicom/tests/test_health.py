@@ -0,0 +1,31 @@
+"""Tests for the /health Orthanc probe."""
+
+from types import SimpleNamespace
+
+import httpx
+
+from app.integrations.dicom.service import DicomService
+from app.main import _check_orthanc
+
+
+def _request(handler) -> SimpleNamespace:
+    """Stand-in request whose app holds a DicomService served by handler."""
+    dicom = DicomService(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(dicom_service=dicom)))
+
+
+class TestCheckOrthanc:
+    """Tests for the Orthanc health probe."""
+
+    async def test_unreachable_reports_unavailable(self):
+        """A connection failure should be reported as "unavailable"."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        assert await _check_orthanc(_request(handler)) == "unavailable"
+
+    async def test_status_reported_when_reachable(self):
+        """A reachable Orthanc should report whether /system answered 200."""
+        assert await _check_orthanc(_request(lambda r: httpx.Response(200))) is True
+        assert await _check_orthanc(_request(lambda r: httpx.Response(503))) is False
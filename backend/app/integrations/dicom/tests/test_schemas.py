@@ -0,0 +1,95 @@
+"""
+DICOM Schema Tests.
+
+Tests for DICOM request/response schemas.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.integrations.dicom.schemas import (
+    Modality,
+    StudyCursor,
+    StudySearchRequest,
+    parse_dicom_date,
+)
+
+
+class TestParseDicomDate:
+    """Test DICOM DA parsing."""
+
+    def test_valid_date(self):
+        """YYYYMMDD should parse to a date."""
+        assert parse_dicom_date("20240229") == date(2024, 2, 29)
+
+    def test_invalid_dates_return_none(self):
+        """Empty, malformed and impossible dates should return None."""
+        for value in (None, "", "2024-02-29", "202402", "20240230", "2024ab01"):
+            assert parse_dicom_date(value) is None
+
+
+class TestStudySearchRequestQidoParams:
+    """Test QIDO-RS parameter building."""
+
+    def test_empty_request_has_no_filters(self):
+        """A request without filters should emit no QIDO parameters."""
+        assert StudySearchRequest().to_qido_params() == []
+
+    def test_filters_are_formatted(self):
+        """Filters should use DICOM keywords, wildcards and code values."""
+        params = StudySearchRequest(
+            patient_id="123456",
+            patient_name="Doe",
+            modality=Modality.US,
+        ).to_qido_params()
+        assert params == [
+            ("PatientID", "123456"),
+            ("PatientName", "*Doe*"),
+            ("ModalitiesInStudy", "US"),
+        ]
+
+    def test_open_ended_date_range(self):
+        """A single date bound should produce an open DICOM range."""
+        params = StudySearchRequest(study_date_from=date(2024, 3, 1)).to_qido_params()
+        assert params == [("StudyDate", "20240301-")]
+
+    def test_single_day_range_is_exact_match(self):
+        """Equal bounds should send a single date rather than a range."""
+        day = date(2024, 3, 1)
+        params = StudySearchRequest(study_date_from=day, study_date_to=day).to_qido_params()
+        assert params == [("StudyDate", "20240301")]
+
+    def test_match_all_range_never_sent(self):
+        """Without bounds no StudyDate filter (in particular "-") is sent."""
+        for request in (StudySearchRequest(), StudySearchRequest(after=StudyCursor("", 0, 40))):
+            assert all(key != "StudyDate" for key, _ in request.to_qido_params())
+
+
+class TestStudyCursor:
+    """Test study search pagination cursors."""
+
+    def test_round_trip(self):
+        """An encoded cursor should decode to the same position."""
+        for cursor in (StudyCursor("20240315", 12, 30), StudyCursor("", 0, 30)):
+            assert StudyCursor.decode(cursor.encode()) == cursor
+
+    def test_malformed_cursor_rejected(self):
+        """Tokens that were not produced by encode() should raise ValueError."""
+        for token in (
+            "!!!",
+            "bm9waXBl",
+            StudyCursor("2024-03", 1, 2).encode(),
+            StudyCursor("20240315", -1, 2).encode(),
+        ):
+            with pytest.raises(ValueError):
+                StudyCursor.decode(token)
+
+    def test_cursor_caps_date_range(self):
+        """A cursor should bound StudyDate at its own date."""
+        params = StudySearchRequest(
+            study_date_from=date(2024, 1, 1),
+            study_date_to=date(2024, 12, 31),
+            after=StudyCursor("20240315", 3, 30),
+        ).to_qido_params()
+        assert params == [("StudyDate", "20240101-20240315")]
@@ -0,0 +1,471 @@
+"""
+DICOM Service Tests.
+
+Tests for DicomService against a mocked Orthanc DICOMweb API.
+"""
+
+import json
+from datetime import date
+
+import httpx
+from pydicom import Dataset
+
+from app.integrations.dicom.schemas import Modality, StudyCursor, StudySearchRequest
+from app.integrations.dicom import service as service_module
+from app.integrations.dicom.service import DicomService
+
+
+def _service(handler, use_orthanc_native: bool = False) -> DicomService:
+    """Build a DicomService whose client is served by handler."""
+    return DicomService(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        use_orthanc_native=use_orthanc_native,
+    )
+
+
+STUDY_ROW = {
+    "0020000D": {"vr": "UI", "Value": ["1.2.3"]},
+    "00100010": {"vr": "PN", "Value": [{"Alphabetic": "DOE^JOHN"}]},
+}
+SERIES_ROW = {
+    "0020000E": {"vr": "UI", "Value": ["1.2.3.4"]},
+    "00080060": {"vr": "CS", "Value": ["US"]},
+}
+
+
+class TestParseModalities:
+    """Test modality code parsing."""
+
+    def test_unknown_codes_skipped_or_defaulted(self):
+        """Unknown study modalities are dropped; unknown series default to SR."""
+        service = _service(lambda request: httpx.Response(200))
+        study = service._parse_study(
+            {**STUDY_ROW, "00080060": {"vr": "CS", "Value": ["US", "OT", "XA"]}}
+        )
+        series = service._parse_series(
+            {**SERIES_ROW, "00080060": {"vr": "CS", "Value": ["OT"]}}
+        )
+
+        assert study.modalities == [Modality.US, Modality.XA]
+        assert series.modality == Modality.SR
+
+
+class TestGetStudy:
+    """Test study retrieval."""
+
+    async def test_study_with_series(self):
+        """Study row and series list should be combined into one study."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/series"):
+                return httpx.Response(200, json=[SERIES_ROW])
+            return httpx.Response(200, json=[STUDY_ROW])
+
+        study = await _service(handler).get_study("1.2.3")
+
+        assert study is not None
+        assert study.patient.patient_name == "DOE^JOHN"
+        assert [s.modality for s in study.series] == [Modality.US]
+
+    async def test_http_error_returns_none(self):
+        """An Orthanc error on either request should yield None."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/series"):
+                return httpx.Response(404)
+            return httpx.Response(200, json=[STUDY_ROW])
+
+        assert await _service(handler).get_study("1.2.3") is None
+
+    async def test_prefetch_embeds_series_thumbnails(self):
+        """Opting in should attach base64 thumbnails to the series."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/thumbnail"):
+                return httpx.Response(200, content=b"jpeg")
+            if request.url.path.endswith("/series"):
+                return httpx.Response(200, json=[SERIES_ROW])
+            return httpx.Response(200, json=[STUDY_ROW])
+
+        service = _service(handler)
+        study = await service.get_study("1.2.3", prefetch_thumbnails=True)
+
+        assert study.series[0].thumbnail == "anBlZw=="
+        # The cached study stays thumbnail-free for plain reads
+        assert (await service.get_study("1.2.3")).series[0].thumbnail is None
+
+    async def test_repeat_reads_served_from_cache(self):
+        """A second read should not hit Orthanc until invalidated."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if request.url.path.endswith("/series"):
+                return httpx.Response(200, json=[SERIES_ROW])
+            return httpx.Response(200, json=[STUDY_ROW])
+
+        service = _service(handler)
+        first = await service.get_study("1.2.3")
+        assert await service.get_study("1.2.3") is first
+        assert len(calls) == 2
+
+        service.invalidate("1.2.3")
+        await service.get_study("1.2.3")
+        assert len(calls) == 4
+
+
+def _study_row(uid: str, study_date: str) -> dict:
+    return {
+        "0020000D": {"vr": "UI", "Value": [uid]},
+        "00080020": {"vr": "DA", "Value": [study_date]},
+    }
+
+
+class TestSearchStudies:
+    """Test QIDO-RS study search pagination."""
+
+    async def test_extra_row_yields_next_cursor(self):
+        """A row beyond per_page should be trimmed and produce a cursor."""
+        rows = [_study_row(f"1.{i}", "20240315") for i in range(3)]
+        sent = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.update(request.url.params)
+            return httpx.Response(200, json=rows)
+
+        result = await _service(handler).search_studies(StudySearchRequest(per_page=2))
+
+        assert sent["limit"] == "3"
+        assert [s.study_instance_uid for s in result.studies] == ["1.0", "1.1"]
+        assert result.total is None
+        assert result.has_next
+        assert StudyCursor.decode(result.next_cursor) == StudyCursor("20240315", 2, 2)
+
+    async def test_last_page_has_exact_total(self):
+        """A short offset page ends the scan and reports the real size."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[_study_row("1.0", "20240315")])
+
+        result = await _service(handler).search_studies(
+            StudySearchRequest(page=3, per_page=2)
+        )
+
+        assert result.total == 5
+        assert not result.has_next
+        assert result.next_cursor is None
+
+    async def test_cursor_skips_rows_already_seen(self):
+        """A cursor should cap the date range and skip that date's seen rows."""
+        sent = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.update(request.url.params)
+            return httpx.Response(
+                200, json=[_study_row("1.2", "20240315"), _study_row("1.0", "20240314")]
+            )
+
+        result = await _service(handler).search_studies(
+            StudySearchRequest(
+                study_date_from=date(2024, 1, 1),
+                per_page=5,
+                after=StudyCursor("20240315", 2, 7),
+            )
+        )
+
+        assert sent["offset"] == "2"
+        assert sent["StudyDate"] == "20240101-20240315"
+        assert [s.study_instance_uid for s in result.studies] == ["1.2", "1.0"]
+        assert not result.has_next
+
+    async def test_cursor_walks_crowded_days(self):
+        """Following cursors should reach every study, even past per_page a day."""
+        # Already in search order; undated studies sort last
+        studies = [(f"1.{i:02}", "20240315") for i in range(25)] + [
+            ("2.1", "20240314"),
+            ("2.2", "20240314"),
+            ("3.1", ""),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            # Minimal QIDO-RS: date range filter, offset and limit
+            params = request.url.params
+            matched = studies
+            if "StudyDate" in params:
+                low, _, high = params["StudyDate"].partition("-")
+                matched = [
+                    s for s in studies if s[1] and low <= s[1] <= (high or "99999999")
+                ]
+            offset = int(params["offset"])
+            window = matched[offset : offset + int(params["limit"])]
+            return httpx.Response(200, json=[_study_row(*study) for study in window])
+
+        service = _service(handler)
+        seen, cursor = [], None
+        while True:
+            result = await service.search_studies(
+                StudySearchRequest(
+                    per_page=10, after=cursor and StudyCursor.decode(cursor)
+                )
+            )
+            seen += [s.study_instance_uid for s in result.studies]
+            if not result.has_next:
+                break
+            cursor = result.next_cursor
+
+        assert seen == [uid for uid, _ in studies]
+
+
+class TestSearchStudiesOrthancNative:
+    """Test study search through Orthanc's /tools/find."""
+
+    async def test_tools_find_results_parsed(self):
+        """Expanded /tools/find studies should map onto DicomStudy."""
+        found = [
+            {
+                "ID": "abc",
+                "MainDicomTags": {
+                    "StudyInstanceUID": "1.2.3",
+                    "StudyDate": "20240315",
+                    "StudyDescription": "Echo",
+                },
+                "PatientMainDicomTags": {"PatientID": "42", "PatientName": "DOE^JOHN"},
+                "RequestedTags": {"ModalitiesInStudy": "US\\SR"},
+                "Series": ["s1", "s2"],
+            }
+        ]
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            assert request.url.path == "/tools/find"
+            return httpx.Response(200, json=found)
+
+        result = await _service(handler, use_orthanc_native=True).search_studies(
+            StudySearchRequest(patient_id="42", page=2, per_page=10)
+        )
+
+        assert bodies[0]["Query"] == {"PatientID": "42"}
+        assert bodies[0]["Limit"] == 11
+        assert bodies[0]["Since"] == 10
+        study = result.studies[0]
+        assert study.study_date == date(2024, 3, 15)
+        assert study.patient.patient_name == "DOE^JOHN"
+        assert study.modalities == [Modality.US, Modality.SR]
+        assert study.series_count == 2
+
+    async def test_falls_back_to_qido_when_rejected(self):
+        """A 404 from /tools/find should switch the service to QIDO-RS."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/tools/find":
+                return httpx.Response(404)
+            return httpx.Response(200, json=[STUDY_ROW])
+
+        service = _service(handler, use_orthanc_native=True)
+        result = await service.search_studies(StudySearchRequest())
+        await service.search_studies(StudySearchRequest())
+
+        assert [s.study_instance_uid for s in result.studies] == ["1.2.3"]
+        assert paths == ["/tools/find", "/dicom-web/studies", "/dicom-web/studies"]
+
+    async def test_falls_back_when_order_by_rejected(self):
+        """A 400 on the first /tools/find (Orthanc < 1.12.5) should use QIDO-RS."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/tools/find":
+                return httpx.Response(400)
+            return httpx.Response(200, json=[STUDY_ROW])
+
+        service = _service(handler, use_orthanc_native=True)
+        result = await service.search_studies(StudySearchRequest())
+
+        assert [s.study_instance_uid for s in result.studies] == ["1.2.3"]
+        assert not service.use_orthanc_native
+        assert paths == ["/tools/find", "/dicom-web/studies"]
+
+    async def test_bad_request_after_success_keeps_tools_find(self):
+        """Once /tools/find has worked, a 400 should fail that search only."""
+        statuses = iter([200, 400])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json=[])
+
+        service = _service(handler, use_orthanc_native=True)
+        await service.search_studies(StudySearchRequest())
+        result = await service.search_studies(StudySearchRequest())
+
+        assert result.studies == []
+        assert service.use_orthanc_native
+
+    async def test_other_client_errors_keep_tools_find(self):
+        """A 401 from /tools/find should fail that search only."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(401)
+
+        service = _service(handler, use_orthanc_native=True)
+        result = await service.search_studies(StudySearchRequest())
+
+        assert result.studies == []
+        assert service.use_orthanc_native
+        assert paths == ["/tools/find"]
+
+
+class TestGetEchoMeasurements:
+    """Test SR discovery and measurement extraction."""
+
+    async def test_echo_series_metadata_parsed(self):
+        """The echo SR series should be chosen and its metadata parsed."""
+        concept = Dataset()
+        concept.CodingSchemeDesignator = "LN"
+        concept.CodeValue = "18043-0"
+        measured = Dataset()
+        measured.NumericValue = "55"
+        item = Dataset()
+        item.ValueType = "NUM"
+        item.ConceptNameCodeSequence = [concept]
+        item.MeasuredValueSequence = [measured]
+        sr = Dataset()
+        sr.StudyInstanceUID = "1.2.3"
+        sr.ContentSequence = [item]
+
+        series = [
+            {
+                "0020000E": {"vr": "UI", "Value": ["1.2.3.8"]},
+                "0008103E": {"vr": "LO", "Value": ["Dose Report"]},
+            },
+            {
+                "0020000E": {"vr": "UI", "Value": ["1.2.3.9"]},
+                "0008103E": {"vr": "LO", "Value": ["Adult Echo SR"]},
+            },
+        ]
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/metadata"):
+                return httpx.Response(200, json=[sr.to_json_dict()])
+            assert request.url.params["Modality"] == "SR"
+            return httpx.Response(200, json=series)
+
+        result = await _service(handler).get_echo_measurements("1.2.3")
+
+        assert result.lv.lvef == 55.0
+        assert paths[-1].endswith("/series/1.2.3.9/metadata")
+        assert len(paths) == 2
+
+
+class TestStreamStudyThumbnail:
+    """Test streamed thumbnail retrieval."""
+
+    async def test_thumbnail_bytes_relayed(self):
+        """The first series' thumbnail should be streamed through."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/thumbnail"):
+                return httpx.Response(200, content=b"\xff\xd8jpeg")
+            return httpx.Response(200, json=[SERIES_ROW])
+
+        chunks = await _service(handler).stream_study_thumbnail("1.2.3")
+
+        assert chunks is not None
+        assert b"".join([chunk async for chunk in chunks]) == b"\xff\xd8jpeg"
+
+    async def test_missing_thumbnail_returns_none(self):
+        """An Orthanc error should be reported before streaming starts."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/thumbnail"):
+                return httpx.Response(404)
+            return httpx.Response(200, json=[SERIES_ROW])
+
+        assert await _service(handler).stream_study_thumbnail("1.2.3") is None
+
+
+class TestDeleteStudy:
+    """Test study deletion through the Orthanc REST API."""
+
+    async def test_orthanc_id_from_search_skips_lookup(self):
+        """IDs seen in /tools/find results should be reused by delete."""
+        found = [{"ID": "abc", "MainDicomTags": {"StudyInstanceUID": "1.2.3"}}]
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.url.path == "/tools/find":
+                return httpx.Response(200, json=found)
+            return httpx.Response(200)
+
+        service = _service(handler, use_orthanc_native=True)
+        await service.search_studies(StudySearchRequest())
+
+        assert await service.delete_study("1.2.3")
+        assert calls[-1] == ("DELETE", "/studies/abc")
+        assert ("POST", "/tools/lookup") not in calls
+
+    async def test_lookup_selects_study_resource(self):
+        """Without a cached ID, /tools/lookup should resolve the study."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.url.path == "/tools/lookup":
+                return httpx.Response(
+                    200,
+                    json=[
+                        {"ID": "p1", "Type": "Patient"},
+                        {"ID": "s1", "Type": "Study"},
+                    ],
+                )
+            return httpx.Response(200)
+
+        assert await _service(handler).delete_study("1.2.3")
+        assert calls == [("POST", "/tools/lookup"), ("DELETE", "/studies/s1")]
+
+
+class TestStoreInstances:
+    """Test batched STOW-RS uploads."""
+
+    async def test_instances_sent_in_one_multipart_request(self):
+        """A small batch should be one multipart/related POST."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            referenced = [
+                {"00081155": {"vr": "UI", "Value": [uid]}} for uid in ("1.1", "1.2")
+            ]
+            return httpx.Response(200, json={"00081199": {"vr": "SQ", "Value": referenced}})
+
+        stored = await _service(handler).store_instances([b"DICM-A", b"DICM-B"])
+
+        assert stored == ["1.1", "1.2"]
+        assert len(requests) == 1
+        content_type = requests[0].headers["Content-Type"]
+        assert content_type.startswith('multipart/related; type="application/dicom"')
+        boundary = content_type.rsplit("boundary=", 1)[1]
+        assert requests[0].content == (
+            f"--{boundary}\r\nContent-Type: application/dicom\r\n\r\nDICM-A\r\n"
+            f"--{boundary}\r\nContent-Type: application/dicom\r\n\r\nDICM-B\r\n"
+            f"--{boundary}--\r\n"
+        ).encode()
+
+    async def test_batches_split_by_size(self, monkeypatch):
+        """Bodies over the size cap should be split across requests."""
+        monkeypatch.setattr(service_module, "STOW_MAX_BATCH_BYTES", 10)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        await _service(handler).store_instances([b"x" * 6, b"y" * 6, b"z" * 3])
+
+        assert len(requests) == 2
@@ -0,0 +1,123 @@
+"""
+Echo SR Parser Tests.
+
+Tests for TID 5100 measurement extraction from pydicom datasets.
+"""
+
+from pydicom.dataset import Dataset
+from pydicom.sequence import Sequence
+
+from app.integrations.dicom.sr_parser import parse_sr_dataset
+
+
+def _code(scheme: str, value: str, meaning: str = "") -> Dataset:
+    code = Dataset()
+    code.CodingSchemeDesignator = scheme
+    code.CodeValue = value
+    code.CodeMeaning = meaning
+    return code
+
+
+def _num(scheme: str, code: str, value: str, unit: str) -> Dataset:
+    measured = Dataset()
+    measured.NumericValue = value
+    measured.MeasurementUnitsCodeSequence = Sequence([_code("UCUM", unit, unit)])
+
+    item = Dataset()
+    item.ValueType = "NUM"
+    item.ConceptNameCodeSequence = Sequence([_code(scheme, code)])
+    item.MeasuredValueSequence = Sequence([measured])
+    return item
+
+
+def _container(*children: Dataset) -> Dataset:
+    item = Dataset()
+    item.ValueType = "CONTAINER"
+    item.ContentSequence = Sequence(list(children))
+    return item
+
+
+def _report(*items: Dataset) -> Dataset:
+    ds = Dataset()
+    ds.StudyInstanceUID = "1.2.3"
+    ds.StudyDate = "20240315"
+    ds.ContentSequence = Sequence(list(items))
+    return ds
+
+
+class TestParseSrDataset:
+    """Test measurement extraction from SR content trees."""
+
+    def test_nested_measurements_extracted(self):
+        """NUM items inside containers should be mapped by concept code."""
+        ds = _report(
+            _container(
+                _num("LN", "18043-0", "55", "%"),
+                _container(_num("SCT", "399221008", "60", "cm/s")),
+            )
+        )
+        result = parse_sr_dataset(ds)
+
+        assert result is not None
+        assert result.lv.lvef == 55.0
+        assert result.diastolic.a_velocity == 60.0
+        assert result.study_date.isoformat() == "2024-03-15"
+
+    def test_dimension_in_cm_converted_to_mm(self):
+        """Dimension fields reported in cm should be stored in mm."""
+        result = parse_sr_dataset(_report(_num("LN", "18083-6", "4.8", "cm")))
+        assert result.lv.lvidd == 48.0
+
+    def test_repeated_dimension_uses_last_value_units(self):
+        """Only the units of the value that is kept should be applied."""
+        ds = _report(
+            _num("LN", "18083-6", "4.8", "cm"),
+            _num("LN", "18083-6", "50", "mm"),
+            _num("LN", "18085-1", "30", "mm"),
+            _num("LN", "18085-1", "3.2", "cm"),
+        )
+        result = parse_sr_dataset(ds)
+        assert result.lv.lvidd == 50.0
+        assert result.lv.lvids == 32.0
+
+    def test_non_dimension_field_not_converted(self):
+        """Fields outside MM_FIELDS keep their value regardless of unit."""
+        result = parse_sr_dataset(_report(_num("SCT", "399223006", "80", "cm")))
+        assert result.diastolic.e_velocity == 80.0
+
+    def test_deeply_nested_tree_does_not_recurse(self):
+        """Nesting beyond the recursion limit should still be traversed."""
+        item = _num("LN", "18043-0", "55", "%")
+        for _ in range(2000):
+            item = _container(item)
+        result = parse_sr_dataset(_report(item))
+        assert result.lv.lvef == 55.0
+
+    def test_later_sibling_overrides_nested_value(self):
+        """Items should be visited in document order."""
+        ds = _report(
+            _container(_num("LN", "18043-0", "50", "%")),
+            _num("LN", "18043-0", "60", "%"),
+        )
+        assert parse_sr_dataset(ds).lv.lvef == 60.0
+
+    def test_inline_numeric_value_used(self):
+        """NUM items without MeasuredValueSequence may carry NumericValue."""
+        item = _num("LN", "18043-0", "55", "%")
+        del item.MeasuredValueSequence
+        item.NumericValue = "57"
+        assert parse_sr_dataset(_report(item)).lv.lvef == 57.0
+
+    def test_items_missing_attributes_skipped(self):
+        """Items without a concept name or value type should be ignored."""
+        nameless = _num("LN", "18043-0", "55", "%")
+        del nameless.ConceptNameCodeSequence
+        untyped = Dataset()
+        ds = _report(nameless, untyped, _num("LN", "18083-6", "48", "mm"))
+        result = parse_sr_dataset(ds)
+        assert result.lv.lvef is None
+        assert result.lv.lvidd == 48.0
+
+    def test_unknown_concepts_ignored(self):
+        """A report with only unknown codes should yield no measurements."""
+        assert parse_sr_dataset(_report(_num("99X", "1", "1", "mm"))) is None
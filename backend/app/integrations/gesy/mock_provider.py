@@ -5,17 +5,20 @@ Provides a mock implementation of IGesyProvider for development and testing.
 Simulates Gesy API responses with realistic data.
 """
 
-import uuid
-from datetime import date, datetime, timedelta
-from typing import Optional
-
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from operator import itemgetter
+from secrets import token_hex
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from app.core.clock import utc_now
 from app.integrations.gesy.interface import GesyApiError, IGesyProvider
 from app.integrations.gesy.schemas import (
     BeneficiaryStatus,
     BeneficiaryType,
     GesyClaim,
     GesyClaimCreate,
-    GesyClaimLineItem,
     GesyClaimStatus,
     GesyProviderInfo,
     GesyReferral,
@@ -24,12 +27,151 @@ from app.integrations.gesy.schemas import (
     GesySpecialty,
 )
 
+# Mock mapping: assume ID cards map to beneficiary IDs
+_CYPRUS_ID_TO_GHS: Mapping[str, str] = MappingProxyType({
+    "1234567": "GHS100001",
+    "7654321": "GHS100002",
+    "1111111": "GHS100003",
+})
+
+# Mock reference data: common cardiology ICD-10 codes
+_VALID_ICD10: frozenset[str] = frozenset({
+    # Ischemic heart disease
+    "I20", "I20.0", "I20.1", "I20.8", "I20.9",  # Angina
+    "I21", "I21.0", "I21.1", "I21.2", "I21.3", "I21.4", "I21.9",  # AMI
+    "I25", "I25.0", "I25.1", "I25.2", "I25.5", "I25.9",  # Chronic IHD
+    # Hypertension
+    "I10", "I11", "I11.0", "I11.9", "I12", "I13",
+    # Heart failure
+    "I50", "I50.0", "I50.1", "I50.9",
+    # Arrhythmias
+    "I48", "I48.0", "I48.1", "I48.2", "I48.9",  # AFib
+    "I49", "I49.0", "I49.1", "I49.9",  # Other arrhythmias
+    # Valvular
+    "I34", "I35", "I36", "I37",
+})
+
+# Every valid code's category (the part before the dot) is itself valid, so
+# prefix matching only needs the distinct categories. Categories are hashed
+# and probed once per distinct length (one length for ICD-10), so the cost
+# stays constant however many codes a full code set adds.
+_ICD10_CATEGORIES: frozenset[str] = frozenset(c.split(".")[0] for c in _VALID_ICD10)
+_ICD10_CATEGORY_LENGTHS: tuple[int, ...] = tuple(
+    sorted({len(c) for c in _ICD10_CATEGORIES})
+)
+
+# Mock reference data: common cardiology CPT codes
+_VALID_CPT: frozenset[str] = frozenset({
+    # ECG
+    "93000", "93005", "93010",
+    # Echocardiography
+    "93303", "93304", "93306", "93307", "93308", "93312", "93315",
+    # Stress testing
+    "93015", "93016", "93017", "93018",
+    # Holter
+    "93224", "93225", "93226", "93227",
+    # Cardiac catheterization
+    "93451", "93452", "93453", "93454", "93455", "93456", "93457", "93458",
+    # PCI
+    "92920", "92921", "92924", "92925", "92928", "92929",
+    # Pacemaker
+    "33206", "33207", "33208", "33210", "33211",
+    # Consultation
+    "99201", "99202", "99203", "99204", "99205",
+    "99211", "99212", "99213", "99214", "99215",
+})
+
+# Referral states that a claim may be submitted against
+_CLAIMABLE_REFERRAL_STATUSES: frozenset[GesyReferralStatus] = frozenset({
+    GesyReferralStatus.APPROVED,
+    GesyReferralStatus.USED,
+})
+
+# Static Gesy specialty reference data, built once at import
+_SPECIALTIES: tuple[GesySpecialty, ...] = (
+    GesySpecialty(
+        code="CAR",
+        name_en="Cardiology",
+        name_el="Καρδιολογία",
+        category="medical",
+        requires_referral=True,
+    ),
+    GesySpecialty(
+        code="CTS",
+        name_en="Cardiothoracic Surgery",
+        name_el="Καρδιοθωρακοχειρουργική",
+        category="surgical",
+        requires_referral=True,
+    ),
+    GesySpecialty(
+        code="INT",
+        name_en="Internal Medicine",
+        name_el="Παθολογία",
+        category="medical",
+        requires_referral=True,
+    ),
+    GesySpecialty(
+        code="GP",
+        name_en="General Practice",
+        name_el="Γενική Ιατρική",
+        category="medical",
+        requires_referral=False,
+    ),
+    GesySpecialty(
+        code="RAD",
+        name_en="Radiology",
+        name_el="Ακτινολογία",
+        category="diagnostic",
+        requires_referral=True,
+    ),
+    GesySpecialty(
+        code="NUC",
+        name_en="Nuclear Medicine",
+        name_el="Πυρηνική Ιατρική",
+        category="diagnostic",
+        requires_referral=True,
+    ),
+)
+
+
+def _cents(amount: float) -> int:
+    """Convert a EUR amount to integer cents."""
+    return round(amount * 100)
+
+
+# Secondary index entries are (date, record_id) pairs kept sorted per owner.
+# Buckets are immutable tuples replaced wholesale on write, so a reader
+# holding a bucket always sees a consistent snapshot.
+_IndexBucket = tuple[tuple[date, str], ...]
+_INDEX_DATE = itemgetter(0)
+
+
+def _index_insert(bucket: _IndexBucket, entry: tuple[date, str]) -> _IndexBucket:
+    """Return a new bucket with entry inserted in sorted position."""
+    i = bisect_right(bucket, entry)
+    return bucket[:i] + (entry,) + bucket[i:]
+
+
+def _index_slice(
+    bucket: _IndexBucket,
+    from_date: Optional[date],
+    to_date: Optional[date],
+) -> _IndexBucket:
+    """Return the entries of a date-sorted index bucket within [from_date, to_date]."""
+    lo = bisect_left(bucket, from_date, key=_INDEX_DATE) if from_date else 0
+    hi = bisect_right(bucket, to_date, key=_INDEX_DATE) if to_date else len(bucket)
+    return bucket[lo:hi]
+
 
 class MockGesyProvider(IGesyProvider):
     """
     Mock implementation of Gesy provider for development.
 
-    Stores data in memory and simulates API behavior.
+    Stores data in memory and simulates API behavior. Records are kept in
+    dicts by ID, with per-beneficiary and per-provider indexes of
+    (date, id) pairs sorted by date, so listings bisect to the requested
+    date range instead of scanning every record. Stored records are
+    replaced rather than mutated.
     """
 
     def __init__(self) -> None:
@@ -39,11 +181,17 @@ class MockGesyProvider(IGesyProvider):
         self._claims: dict[str, GesyClaim] = {}
         self._providers: dict[str, GesyProviderInfo] = {}
 
+        # Secondary indexes: owner ID -> sorted ((date, record_id), ...)
+        self._referrals_by_beneficiary: dict[str, _IndexBucket] = {}
+        self._claims_by_provider: dict[str, _IndexBucket] = {}
+
         # Initialize with sample data
         self._init_sample_data()
 
     def _init_sample_data(self) -> None:
         """Initialize with sample beneficiaries and providers."""
+        now = utc_now()
+
         # Sample beneficiaries
         self._beneficiaries["GHS100001"] = BeneficiaryStatus(
             beneficiary_id="GHS100001",
@@ -52,7 +200,7 @@ class MockGesyProvider(IGesyProvider):
             registration_date=date(2019, 6, 1),
             primary_doctor_id="PD001",
             coverage_category="A",
-            verified_at=datetime.utcnow(),
+            verified_at=now,
         )
         self._beneficiaries["GHS100002"] = BeneficiaryStatus(
             beneficiary_id="GHS100002",
@@ -61,7 +209,7 @@ class MockGesyProvider(IGesyProvider):
             registration_date=date(2020, 3, 15),
             primary_doctor_id="PD002",
             coverage_category="A",
-            verified_at=datetime.utcnow(),
+            verified_at=now,
         )
         self._beneficiaries["GHS100003"] = BeneficiaryStatus(
             beneficiary_id="GHS100003",
@@ -70,7 +218,7 @@ class MockGesyProvider(IGesyProvider):
             registration_date=date(2019, 6, 1),
             expiry_date=date(2023, 12, 31),
             coverage_category="B",
-            verified_at=datetime.utcnow(),
+            verified_at=now,
         )
 
         # Sample providers
@@ -103,9 +251,8 @@ class MockGesyProvider(IGesyProvider):
         """Verify beneficiary by Gesy ID."""
         beneficiary = self._beneficiaries.get(beneficiary_id)
         if beneficiary:
-            # Update verification timestamp
-            beneficiary.verified_at = datetime.utcnow()
-            return beneficiary
+            # Stamp a copy; the stored record is shared and frozen
+            return beneficiary.model_copy(update={"verified_at": utc_now()})
         return None
 
     async def verify_beneficiary_by_id_card(
@@ -113,13 +260,7 @@ class MockGesyProvider(IGesyProvider):
         cyprus_id: str,
     ) -> Optional[BeneficiaryStatus]:
         """Look up beneficiary by Cyprus ID (mock mapping)."""
-        # Mock mapping: assume ID cards map to beneficiary IDs
-        mock_mapping = {
-            "1234567": "GHS100001",
-            "7654321": "GHS100002",
-            "1111111": "GHS100003",
-        }
-        beneficiary_id = mock_mapping.get(cyprus_id)
+        beneficiary_id = _CYPRUS_ID_TO_GHS.get(cyprus_id)
         if beneficiary_id:
             return await self.verify_beneficiary(beneficiary_id)
         return None
@@ -142,7 +283,7 @@ class MockGesyProvider(IGesyProvider):
             )
 
         # Generate referral ID
-        referral_id = f"REF{uuid.uuid4().hex[:8].upper()}"
+        referral_id = f"REF{token_hex(4).upper()}"
 
         # Create referral
         today = date.today()
@@ -164,6 +305,10 @@ class MockGesyProvider(IGesyProvider):
         )
 
         self._referrals[referral_id] = new_referral
+        self._referrals_by_beneficiary[referral.beneficiary_id] = _index_insert(
+            self._referrals_by_beneficiary.get(referral.beneficiary_id, ()),
+            (today, referral_id),
+        )
         return new_referral
 
     async def get_referral(
@@ -187,10 +332,21 @@ class MockGesyProvider(IGesyProvider):
                 error_code="REF001",
             )
 
-        referral.status = status
-        if status == GesyReferralStatus.USED:
-            referral.used_date = date.today()
+        return self._store_referral_status(referral, status, date.today())
 
+    def _store_referral_status(
+        self,
+        referral: GesyReferral,
+        status: GesyReferralStatus,
+        today: date,
+    ) -> GesyReferral:
+        """Store a copy of referral with the new status (used on today)."""
+        # Store a new record rather than mutating one a reader may hold
+        update: dict[str, Any] = {"status": status}
+        if status == GesyReferralStatus.USED:
+            update["used_date"] = today
+        referral = referral.model_copy(update=update)
+        self._referrals[referral.referral_id] = referral
         return referral
 
     async def list_patient_referrals(
@@ -201,18 +357,18 @@ class MockGesyProvider(IGesyProvider):
         to_date: Optional[date] = None,
     ) -> list[GesyReferral]:
         """List referrals for a patient."""
-        results = []
-        for referral in self._referrals.values():
-            if referral.beneficiary_id != beneficiary_id:
-                continue
-            if status and referral.status != status:
-                continue
-            if from_date and referral.issued_date < from_date:
-                continue
-            if to_date and referral.issued_date > to_date:
-                continue
-            results.append(referral)
-        return results
+        bucket = self._referrals_by_beneficiary.get(beneficiary_id)
+        if not bucket:
+            return []
+        records = self._referrals
+        entries = _index_slice(bucket, from_date, to_date)
+        if status is None:
+            return [records[referral_id] for _, referral_id in entries]
+        return [
+            referral
+            for referral in (records[referral_id] for _, referral_id in entries)
+            if referral.status == status
+        ]
 
     # =========================================================================
     # Claims
@@ -230,36 +386,28 @@ class MockGesyProvider(IGesyProvider):
                 f"Referral {claim.referral_id} not found",
                 error_code="CLM001",
             )
-        if referral.status not in [GesyReferralStatus.APPROVED, GesyReferralStatus.USED]:
+        if referral.status not in _CLAIMABLE_REFERRAL_STATUSES:
             raise GesyApiError(
                 f"Referral {claim.referral_id} is not valid for claims",
                 error_code="CLM002",
             )
 
-        # Calculate totals
-        total_claimed = sum(item.total_price for item in claim.line_items)
+        # Calculate totals in integer cents to avoid float drift
+        total_claimed = sum(_cents(item.total_price) for item in claim.line_items) / 100
 
         # Generate claim ID
-        claim_id = f"CLM{uuid.uuid4().hex[:8].upper()}"
+        claim_id = f"CLM{token_hex(4).upper()}"
 
         # Create claim (auto-approve in mock)
-        approved_items = []
-        total_approved = 0.0
-        for item in claim.line_items:
-            approved_item = GesyClaimLineItem(
-                line_number=item.line_number,
-                procedure_code=item.procedure_code,
-                procedure_description=item.procedure_description,
-                quantity=item.quantity,
-                unit_price=item.unit_price,
-                total_price=item.total_price,
-                diagnosis_codes=item.diagnosis_codes,
-                approved=True,
-                approved_amount=item.total_price,
+        approved_items = [
+            item.model_copy(
+                update={"approved": True, "approved_amount": item.total_price}
             )
-            approved_items.append(approved_item)
-            total_approved += item.total_price
+            for item in claim.line_items
+        ]
+        total_approved = total_claimed
 
+        now = utc_now()
         new_claim = GesyClaim(
             claim_id=claim_id,
             referral_id=claim.referral_id,
@@ -273,17 +421,18 @@ class MockGesyProvider(IGesyProvider):
             total_claimed=total_claimed,
             total_approved=total_approved,
             status=GesyClaimStatus.APPROVED,
-            submitted_at=datetime.utcnow(),
-            reviewed_at=datetime.utcnow(),
+            submitted_at=now,
+            reviewed_at=now,
         )
 
         self._claims[claim_id] = new_claim
+        self._claims_by_provider[claim.provider_id] = _index_insert(
+            self._claims_by_provider.get(claim.provider_id, ()),
+            (claim.service_date, claim_id),
+        )
 
         # Mark referral as used
-        await self.update_referral_status(
-            claim.referral_id,
-            GesyReferralStatus.USED,
-        )
+        self._store_referral_status(referral, GesyReferralStatus.USED, date.today())
 
         return new_claim
 
@@ -302,18 +451,18 @@ class MockGesyProvider(IGesyProvider):
         to_date: Optional[date] = None,
     ) -> list[GesyClaim]:
         """List claims for a provider."""
-        results = []
-        for claim in self._claims.values():
-            if claim.provider_id != provider_id:
-                continue
-            if status and claim.status != status:
-                continue
-            if from_date and claim.service_date < from_date:
-                continue
-            if to_date and claim.service_date > to_date:
-                continue
-            results.append(claim)
-        return results
+        bucket = self._claims_by_provider.get(provider_id)
+        if not bucket:
+            return []
+        records = self._claims
+        entries = _index_slice(bucket, from_date, to_date)
+        if status is None:
+            return [records[claim_id] for _, claim_id in entries]
+        return [
+            claim
+            for claim in (records[claim_id] for _, claim_id in entries)
+            if claim.status == status
+        ]
 
     # =========================================================================
     # Provider & Reference Data
@@ -328,96 +477,21 @@ class MockGesyProvider(IGesyProvider):
 
     async def list_specialties(self) -> list[GesySpecialty]:
         """Get list of Gesy specialties."""
-        return [
-            GesySpecialty(
-                code="CAR",
-                name_en="Cardiology",
-                name_el="Καρδιολογία",
-                category="medical",
-                requires_referral=True,
-            ),
-            GesySpecialty(
-                code="CTS",
-                name_en="Cardiothoracic Surgery",
-                name_el="Καρδιοθωρακοχειρουργική",
-                category="surgical",
-                requires_referral=True,
-            ),
-            GesySpecialty(
-                code="INT",
-                name_en="Internal Medicine",
-                name_el="Παθολογία",
-                category="medical",
-                requires_referral=True,
-            ),
-            GesySpecialty(
-                code="GP",
-                name_en="General Practice",
-                name_el="Γενική Ιατρική",
-                category="medical",
-                requires_referral=False,
-            ),
-            GesySpecialty(
-                code="RAD",
-                name_en="Radiology",
-                name_el="Ακτινολογία",
-                category="diagnostic",
-                requires_referral=True,
-            ),
-            GesySpecialty(
-                code="NUC",
-                name_en="Nuclear Medicine",
-                name_el="Πυρηνική Ιατρική",
-                category="diagnostic",
-                requires_referral=True,
-            ),
-        ]
+        return list(_SPECIALTIES)
 
     async def validate_diagnosis_code(
         self,
         code: str,
     ) -> bool:
         """Validate ICD-10 code (mock - accepts common cardiology codes)."""
-        valid_codes = {
-            # Ischemic heart disease
-            "I20", "I20.0", "I20.1", "I20.8", "I20.9",  # Angina
-            "I21", "I21.0", "I21.1", "I21.2", "I21.3", "I21.4", "I21.9",  # AMI
-            "I25", "I25.0", "I25.1", "I25.2", "I25.5", "I25.9",  # Chronic IHD
-            # Hypertension
-            "I10", "I11", "I11.0", "I11.9", "I12", "I13",
-            # Heart failure
-            "I50", "I50.0", "I50.1", "I50.9",
-            # Arrhythmias
-            "I48", "I48.0", "I48.1", "I48.2", "I48.9",  # AFib
-            "I49", "I49.0", "I49.1", "I49.9",  # Other arrhythmias
-            # Valvular
-            "I34", "I35", "I36", "I37",
-        }
         # Accept code or any code that starts with a valid prefix
-        return code in valid_codes or any(code.startswith(c) for c in valid_codes)
+        return code in _VALID_ICD10 or any(
+            code[:n] in _ICD10_CATEGORIES for n in _ICD10_CATEGORY_LENGTHS
+        )
 
     async def validate_procedure_code(
         self,
         code: str,
     ) -> bool:
         """Validate CPT code (mock - accepts common cardiology codes)."""
-        valid_codes = {
-            # ECG
-            "93000", "93005", "93010",
-            # Echocardiography
-            "93303", "93304", "93306", "93307", "93308", "93312", "93315",
-            # Stress testing
-            "93015", "93016", "93017", "93018",
-            # Holter
-            "93224", "93225", "93226", "93227",
-            # Cardiac catheterization
-            "93451", "93452", "93453", "93454", "93455", "93456", "93457", "93458",
-            # PCI
-            "92920", "92921", "92924", "92925", "92928", "92929",
-            # Pacemaker
-            "33206", "33207", "33208", "33210", "33211",
-            # Consultation
-            "99201", "99202", "99203", "99204", "99205",
-            "99211", "99212", "99213", "99214", "99215",
-        }
-        return code in valid_codes
+        return code in _VALID_CPT
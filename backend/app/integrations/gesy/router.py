@@ -8,12 +8,17 @@ Exposes endpoints for Cyprus General Healthcare System (GHS) integration:
 - Reference data (specialties, code validation)
 """
 
+import logging
 from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from app.core.permissions import Permission, require_permission
+from app.core.redis import get_redis
 from app.integrations.gesy.interface import GesyApiError
 from app.integrations.gesy.schemas import (
     BeneficiaryStatus,
@@ -27,8 +32,95 @@ from app.integrations.gesy.schemas import (
 )
 from app.integrations.gesy.service import GesyService, get_gesy_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/gesy", tags=["Gesy"])
 
+# Reference data is shared across workers through Redis; a Redis outage
+# only disables this layer (GesyService keeps its own in-process cache)
+SPECIALTIES_CACHE_KEY = "gesy:specialties"
+SPECIALTIES_CACHE_TTL_SECONDS = 3600
+CODE_CACHE_PREFIX = "gesy:"  # + "dx:{code}" / "cpt:{code}"
+CODE_CACHE_TTL_SECONDS = 86400
+
+# List endpoints serialize straight to JSON bytes in pydantic-core, skipping
+# FastAPI's re-validation of every item against response_model (which is
+# kept on the routes for the OpenAPI schema)
+_REFERRAL_LIST = TypeAdapter(list[GesyReferral])
+_CLAIM_LIST = TypeAdapter(list[GesyClaim])
+_SPECIALTY_LIST = TypeAdapter(list[GesySpecialty])
+
+
+def _json_list(adapter: TypeAdapter, items: list) -> Response:
+    """Serialize a list of models with a prebuilt adapter."""
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
+
+async def _cached_code_validity(
+    redis: Redis,
+    kind: str,
+    codes: list[str],
+    service: GesyService,
+) -> dict[str, bool]:
+    """
+    Validate codes through a two-level cache.
+
+    The service's in-process cache is checked first, then the shared
+    Redis cache with a single MGET (hits are promoted in-process), and
+    the remaining misses are validated concurrently through the
+    service's batch API.
+
+    Args:
+        redis: Redis client
+        kind: "dx" for ICD-10 or "cpt" for CPT codes
+        codes: Codes to validate
+        service: GesyService used on cache misses
+
+    Returns:
+        Mapping of each code to its validity
+    """
+    validate_many = (
+        service.validate_diagnosis_codes
+        if kind == "dx"
+        else service.validate_procedure_codes
+    )
+    codes = list(dict.fromkeys(codes))
+    results = service.cached_code_validity(kind, codes)
+    remote = [code for code in codes if code not in results]
+    if not remote:
+        return results
+
+    keys = [f"{CODE_CACHE_PREFIX}{kind}:{code}" for code in remote]
+    try:
+        cached = await redis.mget(keys)
+    except RedisError as e:
+        logger.warning(f"Gesy code cache read failed: {e}")
+        cached = [None] * len(remote)
+
+    shared = {
+        code: value == "1"
+        for code, value in zip(remote, cached)
+        if value is not None
+    }
+    service.remember_code_validity(kind, shared)
+    results.update(shared)
+    misses = [code for code in remote if code not in shared]
+    if misses:
+        fresh = await validate_many(misses)
+        results.update(fresh)
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for code, valid in fresh.items():
+                    pipe.set(
+                        f"{CODE_CACHE_PREFIX}{kind}:{code}",
+                        "1" if valid else "0",
+                        ex=CODE_CACHE_TTL_SECONDS,
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Gesy code cache write failed: {e}")
+    return {code: results[code] for code in codes}
+
 
 def _get_provider_id(request: Request) -> str:
     """Extract the clinic's Gesy provider ID from request context."""
@@ -161,11 +253,12 @@ async def list_referrals(
     from_date: Optional[date] = Query(None, description="Filter from date"),
     to_date: Optional[date] = Query(None, description="Filter to date"),
     service: GesyService = Depends(get_gesy_service),
-) -> list[GesyReferral]:
+) -> Response:
     """List referrals for a patient with optional filters."""
-    return await service.list_patient_referrals(
+    referrals = await service.list_patient_referrals(
         beneficiary_id, referral_status, from_date, to_date
     )
+    return _json_list(_REFERRAL_LIST, referrals)
 
 
 # =============================================================================
@@ -228,12 +321,13 @@ async def list_claims(
     from_date: Optional[date] = Query(None, description="Filter from date"),
     to_date: Optional[date] = Query(None, description="Filter to date"),
     service: GesyService = Depends(get_gesy_service),
-) -> list[GesyClaim]:
+) -> Response:
     """List claims for the current provider/clinic."""
     provider_id = _get_provider_id(request)
-    return await service.list_provider_claims(
+    claims = await service.list_provider_claims(
         provider_id, claim_status, from_date, to_date
     )
+    return _json_list(_CLAIM_LIST, claims)
 
 
 # =============================================================================
@@ -248,9 +342,51 @@ async def list_claims(
 )
 async def list_specialties(
     service: GesyService = Depends(get_gesy_service),
-) -> list[GesySpecialty]:
+    redis: Redis = Depends(get_redis),
+) -> Response:
     """Get list of all Gesy medical specialties."""
-    return await service.list_specialties()
+    try:
+        cached = await redis.get(SPECIALTIES_CACHE_KEY)
+    except RedisError as e:
+        logger.warning(f"Gesy specialties cache read failed: {e}")
+        cached = None
+    if cached:
+        return Response(content=cached, media_type="application/json")
+
+    payload = _SPECIALTY_LIST.dump_json(await service.list_specialties())
+    try:
+        await redis.set(
+            SPECIALTIES_CACHE_KEY, payload, ex=SPECIALTIES_CACHE_TTL_SECONDS
+        )
+    except RedisError as e:
+        logger.warning(f"Gesy specialties cache write failed: {e}")
+    return Response(content=payload, media_type="application/json")
+
+
+@router.get(
+    "/validate/diagnosis",
+    summary="Validate several ICD-10 codes",
+)
+async def validate_diagnosis_codes(
+    codes: list[str] = Query(..., min_length=1, max_length=100),
+    service: GesyService = Depends(get_gesy_service),
+    redis: Redis = Depends(get_redis),
+) -> dict[str, bool]:
+    """Validate ICD-10 codes in one request (e.g. all codes on a claim)."""
+    return await _cached_code_validity(redis, "dx", codes, service)
+
+
+@router.get(
+    "/validate/procedure",
+    summary="Validate several CPT codes",
+)
+async def validate_procedure_codes(
+    codes: list[str] = Query(..., min_length=1, max_length=100),
+    service: GesyService = Depends(get_gesy_service),
+    redis: Redis = Depends(get_redis),
+) -> dict[str, bool]:
+    """Validate CPT codes in one request (e.g. all claim line items)."""
+    return await _cached_code_validity(redis, "cpt", codes, service)
 
 
 @router.get(
@@ -260,10 +396,11 @@ async def list_specialties(
 async def validate_diagnosis_code(
     code: str,
     service: GesyService = Depends(get_gesy_service),
+    redis: Redis = Depends(get_redis),
 ) -> dict:
     """Validate an ICD-10 diagnosis code against Gesy standards."""
-    valid = await service.validate_diagnosis_code(code)
-    return {"code": code, "valid": valid}
+    results = await _cached_code_validity(redis, "dx", [code], service)
+    return {"code": code, "valid": results[code]}
 
 
 @router.get(
@@ -273,7 +410,8 @@ async def validate_diagnosis_code(
 async def validate_procedure_code(
     code: str,
     service: GesyService = Depends(get_gesy_service),
+    redis: Redis = Depends(get_redis),
 ) -> dict:
     """Validate a CPT procedure code against Gesy standards."""
-    valid = await service.validate_procedure_code(code)
-    return {"code": code, "valid": valid}
+    results = await _cached_code_validity(redis, "cpt", [code], service)
+    return {"code": code, "valid": results[code]}
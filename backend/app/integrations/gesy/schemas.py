@@ -8,7 +8,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BeneficiaryType(str, Enum):
@@ -23,6 +23,8 @@ class BeneficiaryType(str, Enum):
 class BeneficiaryStatus(BaseModel):
     """Status of a Gesy beneficiary."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     beneficiary_id: str = Field(..., description="Gesy beneficiary ID")
     is_active: bool = Field(..., description="Whether beneficiary is currently active")
     beneficiary_type: BeneficiaryType
@@ -67,6 +69,8 @@ class GesyReferralCreate(BaseModel):
 class GesyReferral(BaseModel):
     """A Gesy referral voucher."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     referral_id: str = Field(..., description="Unique referral voucher ID")
     beneficiary_id: str
     referring_doctor_id: str
@@ -108,6 +112,8 @@ class GesyClaimStatus(str, Enum):
 class GesyClaimLineItem(BaseModel):
     """A line item in a Gesy claim."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     line_number: int
     procedure_code: str = Field(..., description="CPT code")
     procedure_description: str
@@ -150,6 +156,8 @@ class GesyClaimCreate(BaseModel):
 class GesyClaim(BaseModel):
     """A Gesy claim for reimbursement."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     claim_id: str = Field(..., description="Unique claim ID")
     referral_id: str
     provider_id: str
@@ -182,6 +190,8 @@ class GesyClaim(BaseModel):
 class GesyProviderInfo(BaseModel):
     """Information about a Gesy healthcare provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     provider_id: str
     name: str
     provider_type: str = Field(..., description="specialist, personal_doctor, hospital")
@@ -195,6 +205,9 @@ class GesyProviderInfo(BaseModel):
 class GesySpecialty(BaseModel):
     """A Gesy specialty category."""
 
+    # Static reference data shared between callers
+    model_config = ConfigDict(frozen=True)
+
     code: str
     name_en: str
     name_el: str
@@ -5,10 +5,13 @@ Wraps IGesyProvider for dependency injection and provides
 business logic for beneficiary, referral, and claim management.
 """
 
+import asyncio
 from datetime import date
-from functools import lru_cache
-from typing import Optional
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
 
+from fastapi import Request
+
+from app.core.cache import TTLCache
 from app.integrations.gesy.interface import GesyApiError, IGesyProvider
 from app.integrations.gesy.mock_provider import MockGesyProvider
 from app.integrations.gesy.schemas import (
@@ -22,12 +25,60 @@ from app.integrations.gesy.schemas import (
     GesySpecialty,
 )
 
+T = TypeVar("T")
+
 
 class GesyService:
-    """Service layer for Gesy GHS operations."""
+    """
+    Service layer for Gesy GHS operations.
+
+    One instance is shared per process (see get_gesy_service) so that
+    recent beneficiary verifications are reused for a short TTL instead of
+    re-querying the provider for the usual "verify, then refer" sequence.
+    Identical list queries that arrive while one is already in flight
+    share its result rather than each reaching the provider. Reference
+    data (specialties, code validity) changes rarely and is cached for
+    longer.
+    """
+
+    BENEFICIARY_CACHE_SIZE = 1024
+    BENEFICIARY_CACHE_TTL_SECONDS = 30
+    CODE_CACHE_SIZE = 4096
+    CODE_CACHE_TTL_SECONDS = 86400
+    SPECIALTIES_TTL_SECONDS = 3600
 
     def __init__(self, provider: IGesyProvider) -> None:
         self._provider = provider
+        self._beneficiaries: TTLCache[str, BeneficiaryStatus] = TTLCache(
+            maxsize=self.BENEFICIARY_CACHE_SIZE,
+            ttl=self.BENEFICIARY_CACHE_TTL_SECONDS,
+        )
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        # Keyed by ("dx" | "cpt", code) and "specialties" respectively
+        self._code_validity: TTLCache[tuple[str, str], bool] = TTLCache(
+            maxsize=self.CODE_CACHE_SIZE, ttl=self.CODE_CACHE_TTL_SECONDS
+        )
+        self._specialties: TTLCache[str, tuple[GesySpecialty, ...]] = TTLCache(
+            maxsize=1, ttl=self.SPECIALTIES_TTL_SECONDS
+        )
+
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fetch once for all concurrent callers with the same key.
+
+        The shared call is shielded so a cancelled caller does not cancel
+        it for the others.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    def invalidate_beneficiary(self, beneficiary_id: str) -> None:
+        """Drop a cached verification, e.g. on a status-change notification."""
+        self._beneficiaries.pop(beneficiary_id)
 
     # =========================================================================
     # Beneficiary Verification
@@ -37,8 +88,15 @@ class GesyService:
         self,
         beneficiary_id: str,
     ) -> Optional[BeneficiaryStatus]:
-        """Verify beneficiary by Gesy ID."""
-        return await self._provider.verify_beneficiary(beneficiary_id)
+        """Verify beneficiary by Gesy ID, reusing a recent verification."""
+        cached = self._beneficiaries.get(beneficiary_id)
+        if cached is not None:
+            return cached
+        result = await self._provider.verify_beneficiary(beneficiary_id)
+        # Misses are not cached so new registrations show up immediately
+        if result is not None:
+            self._beneficiaries[beneficiary_id] = result
+        return result
 
     async def verify_beneficiary_by_id_card(
         self,
@@ -83,9 +141,14 @@ class GesyService:
         to_date: Optional[date] = None,
     ) -> list[GesyReferral]:
         """List referrals for a patient with optional filters."""
-        return await self._provider.list_patient_referrals(
-            beneficiary_id, status, from_date, to_date
+        referrals = await self._coalesce(
+            ("referrals", beneficiary_id, status, from_date, to_date),
+            lambda: self._provider.list_patient_referrals(
+                beneficiary_id, status, from_date, to_date
+            ),
         )
+        # Each caller gets its own list; the models are shared
+        return list(referrals)
 
     # =========================================================================
     # Claims
@@ -113,9 +176,13 @@ class GesyService:
         to_date: Optional[date] = None,
     ) -> list[GesyClaim]:
         """List claims for a provider."""
-        return await self._provider.list_provider_claims(
-            provider_id, status, from_date, to_date
+        claims = await self._coalesce(
+            ("claims", provider_id, status, from_date, to_date),
+            lambda: self._provider.list_provider_claims(
+                provider_id, status, from_date, to_date
+            ),
         )
+        return list(claims)
 
     # =========================================================================
     # Reference Data
@@ -123,23 +190,79 @@ class GesyService:
 
     async def list_specialties(self) -> list[GesySpecialty]:
         """Get list of Gesy specialties."""
-        return await self._provider.list_specialties()
+        specialties = self._specialties.get("specialties")
+        if specialties is None:
+            specialties = tuple(await self._provider.list_specialties())
+            self._specialties["specialties"] = specialties
+        return list(specialties)
+
+    def cached_code_validity(self, kind: str, codes: list[str]) -> dict[str, bool]:
+        """
+        Return the verdicts already cached in this process.
+
+        Args:
+            kind: "dx" for ICD-10 or "cpt" for CPT codes
+            codes: Codes to look up
+
+        Returns:
+            Mapping of each cached code to its validity (misses omitted)
+        """
+        cached = {}
+        for code in codes:
+            valid = self._code_validity.get((kind, code))
+            if valid is not None:
+                cached[code] = valid
+        return cached
+
+    def remember_code_validity(self, kind: str, verdicts: dict[str, bool]) -> None:
+        """Cache verdicts obtained elsewhere (e.g. the shared Redis cache)."""
+        for code, valid in verdicts.items():
+            self._code_validity[(kind, code)] = valid
+
+    async def _validate_code(
+        self,
+        kind: str,
+        code: str,
+        validate: Callable[[str], Awaitable[bool]],
+    ) -> bool:
+        """Validate a code through the provider, caching the verdict."""
+        key = (kind, code)
+        valid = self._code_validity.get(key)
+        if valid is None:
+            valid = await validate(code)
+            self._code_validity[key] = valid
+        return valid
 
     async def validate_diagnosis_code(self, code: str) -> bool:
         """Validate an ICD-10 diagnosis code."""
-        return await self._provider.validate_diagnosis_code(code)
+        return await self._validate_code(
+            "dx", code, self._provider.validate_diagnosis_code
+        )
 
     async def validate_procedure_code(self, code: str) -> bool:
         """Validate a CPT procedure code."""
-        return await self._provider.validate_procedure_code(code)
+        return await self._validate_code(
+            "cpt", code, self._provider.validate_procedure_code
+        )
+
+    async def validate_diagnosis_codes(self, codes: list[str]) -> dict[str, bool]:
+        """Validate several ICD-10 codes concurrently."""
+        unique = list(dict.fromkeys(codes))
+        results = await asyncio.gather(*map(self.validate_diagnosis_code, unique))
+        return dict(zip(unique, results))
+
+    async def validate_procedure_codes(self, codes: list[str]) -> dict[str, bool]:
+        """Validate several CPT codes concurrently."""
+        unique = list(dict.fromkeys(codes))
+        results = await asyncio.gather(*map(self.validate_procedure_code, unique))
+        return dict(zip(unique, results))
 
 
-@lru_cache()
-def _get_gesy_provider() -> IGesyProvider:
-    """Get singleton Gesy provider instance (mock for development)."""
-    return MockGesyProvider()
+def create_gesy_service() -> GesyService:
+    """Build the process-wide GesyService (mock provider for development)."""
+    return GesyService(MockGesyProvider())
 
 
-def get_gesy_service() -> GesyService:
-    """FastAPI dependency for GesyService."""
-    return GesyService(_get_gesy_provider())
+def get_gesy_service(request: Request) -> GesyService:
+    """FastAPI dependency for the application-wide GesyService."""
+    return request.app.state.gesy_service
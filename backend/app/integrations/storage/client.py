@@ -1,13 +1,18 @@
 """
 S3/MinIO storage client for file operations.
 
-Uses boto3 with endpoint_url override for MinIO compatibility.
+Uses boto3 with endpoint_url override for MinIO compatibility. boto3 is
+blocking, so methods that talk to S3 are coroutines that run the call in
+a worker thread; presigning is local computation and stays synchronous.
 """
 
+import asyncio
+import io
 import logging
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -15,46 +20,77 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+_MISSING_BUCKET_CODES = frozenset({"404", "NoSuchBucket"})
+
+# Uploads above 8 MiB are sent as multipart in 8 MiB parts, up to 4 at once,
+# so large attachments are streamed in parts rather than one PutObject body
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+    max_concurrency=4,
+    use_threads=True,
+)
+
 
 class StorageClient:
     """S3-compatible storage client for MinIO."""
 
     def __init__(self) -> None:
-        s3_config = Config(signature_version="s3v4")
-        # Internal client for uploads/deletes (uses Docker-internal endpoint)
-        self._client = boto3.client(
-            "s3",
-            endpoint_url=settings.s3_endpoint,
+        # One session for both clients so the S3 service model is loaded once.
+        # The pool is raised above urllib3's default of 10 for concurrent
+        # uploads, and failed calls are retried once.
+        session = boto3.session.Session(
             aws_access_key_id=settings.s3_access_key,
             aws_secret_access_key=settings.s3_secret_key,
             region_name=settings.s3_region,
+        )
+        s3_config = Config(
+            signature_version="s3v4",
+            max_pool_connections=50,
+            retries={"max_attempts": 2, "mode": "standard"},
+        )
+        # Internal client for uploads/deletes (uses Docker-internal endpoint)
+        self._client = session.client(
+            "s3",
+            endpoint_url=settings.s3_endpoint,
             config=s3_config,
         )
         # Public client for presigned URLs (uses browser-accessible endpoint)
-        self._public_client = boto3.client(
+        self._public_client = session.client(
             "s3",
             endpoint_url=settings.s3_public_endpoint,
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            region_name=settings.s3_region,
             config=s3_config,
         )
 
-    def upload_file(
+    async def upload_file(
         self,
         bucket: str,
         key: str,
-        content: bytes,
+        content: Union[bytes, BinaryIO],
         content_type: str,
     ) -> None:
-        """Upload file bytes to S3/MinIO."""
-        self._client.put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=content,
-            ContentType=content_type,
+        """
+        Upload a file to S3/MinIO.
+
+        Args:
+            bucket: Target bucket
+            key: Object key
+            content: File bytes, or a readable binary file object (e.g.
+                UploadFile.file) that is streamed without reading it whole
+            content_type: MIME type stored on the object
+        """
+        # BytesIO shares the bytes buffer rather than copying it
+        fileobj = io.BytesIO(content) if isinstance(content, bytes) else content
+        await asyncio.to_thread(
+            self._client.upload_fileobj,
+            fileobj,
+            bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=UPLOAD_TRANSFER_CONFIG,
         )
-        logger.info(f"Uploaded {key} to {bucket} ({len(content)} bytes)")
+        logger.info(f"Uploaded {key} to {bucket}")
 
     def generate_presigned_url(
         self,
@@ -75,20 +111,20 @@ class StorageClient:
         )
         return url
 
-    def delete_file(self, bucket: str, key: str) -> None:
+    async def delete_file(self, bucket: str, key: str) -> None:
         """Delete a file from S3/MinIO."""
-        self._client.delete_object(Bucket=bucket, Key=key)
+        await asyncio.to_thread(self._client.delete_object, Bucket=bucket, Key=key)
         logger.info(f"Deleted {key} from {bucket}")
 
-    def ensure_bucket(self, bucket: str) -> None:
+    async def ensure_bucket(self, bucket: str) -> None:
         """Create bucket if it doesn't exist."""
         try:
-            self._client.head_bucket(Bucket=bucket)
+            await asyncio.to_thread(self._client.head_bucket, Bucket=bucket)
             logger.info(f"Bucket '{bucket}' exists")
         except ClientError as e:
-            error_code = int(e.response["Error"]["Code"])
-            if error_code == 404:
-                self._client.create_bucket(Bucket=bucket)
+            # HeadBucket reports "404"; some S3 implementations use the name
+            if e.response["Error"]["Code"] in _MISSING_BUCKET_CODES:
+                await asyncio.to_thread(self._client.create_bucket, Bucket=bucket)
                 logger.info(f"Created bucket '{bucket}'")
             else:
                 raise
@@ -4,19 +4,23 @@ OpenHeart Cyprus - FastAPI Application Entry Point.
 A GDPR-compliant Cardiology EMR for Cypriot cardiologists.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import orjson
 import redis.asyncio as redis
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from sqlalchemy import text
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.core.audit import AuditMiddleware
+from app.core.responses import OpenHeartJSONResponse
 from app.db.session import engine
+from app.integrations.dicom.service import DicomService
+from app.integrations.gesy.service import create_gesy_service
 
 # Import all models to ensure SQLAlchemy mapper resolution works
 import app.integrations.dicom.mwl_models  # noqa: F401 - ScheduledProcedure for Patient relationship
@@ -28,6 +32,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared by the startup check and /health; the statement is built once
+_PING = text("SELECT 1")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -43,10 +50,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         decode_responses=True,
     )
 
+    # DICOM service with a shared, pooled HTTP client for Orthanc
+    app.state.dicom_service = DicomService()
+
+    # Gesy service (and its provider) built up front so the first request
+    # doesn't pay for construction; it owns the in-process Gesy caches
+    app.state.gesy_service = create_gesy_service()
+
     # Verify database connection
     try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(_PING)
         logger.info("Database connection verified")
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
@@ -72,15 +87,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         from app.integrations.storage import get_storage_client
         storage = get_storage_client()
-        storage.ensure_bucket(settings.s3_bucket)
+        await storage.ensure_bucket(settings.s3_bucket)
     except Exception as e:
         logger.warning(f"MinIO bucket initialization failed (non-fatal): {e}")
 
+    # Build the OpenAPI schema now rather than on the first docs request
+    if app.openapi_url:
+        app.openapi()
+
     yield
 
     # Shutdown
     logger.info("Shutting down application")
     await app.state.redis.close()
+    await app.state.dicom_service.aclose()
     await engine.dispose()
 
 
@@ -94,7 +114,7 @@ app = FastAPI(
     docs_url="/docs" if not settings.is_production else None,
     redoc_url="/redoc" if not settings.is_production else None,
     openapi_url="/openapi.json" if not settings.is_production else None,
-    default_response_class=ORJSONResponse,
+    default_response_class=OpenHeartJSONResponse,
     lifespan=lifespan,
 )
 
@@ -121,43 +141,36 @@ app.add_middleware(AuditMiddleware)
 # =============================================================================
 
 
-@app.get("/health", tags=["Health"])
-async def health_check(request: Request) -> dict:
-    """
-    Health check endpoint for container orchestration.
-
-    Returns status of all dependent services.
-    """
-    checks: dict[str, bool | str] = {}
-
-    # Database check
+async def _check_database() -> bool | str:
+    """Ping the database; autocommit skips the BEGIN/COMMIT around it."""
     try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-        checks["database"] = True
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(_PING)
+        return True
     except Exception as e:
-        checks["database"] = f"Error: {str(e)}"
+        return f"Error: {str(e)}"
+
 
-    # Redis check
+async def _check_redis(request: Request) -> bool | str:
+    """Ping Redis."""
     try:
         await request.app.state.redis.ping()
-        checks["redis"] = True
+        return True
     except Exception as e:
-        checks["redis"] = f"Error: {str(e)}"
+        return f"Error: {str(e)}"
 
-    # Orthanc check (non-critical)
+
+async def _check_orthanc(request: Request) -> bool | str:
+    """Probe Orthanc (non-critical) over the DICOM service's pooled client."""
     try:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                f"{settings.orthanc_url}/system",
-                auth=(settings.orthanc_username, settings.orthanc_password),
-            )
-            checks["orthanc"] = response.status_code == 200
+        return await request.app.state.dicom_service.ping()
     except Exception:
-        checks["orthanc"] = "unavailable"
+        return "unavailable"
+
 
+def _health_body(checks: dict[str, bool | str]) -> dict:
+    """Build the /health response body from the probe results."""
     # Determine overall health
     critical_services = ["database", "redis"]
     all_healthy = all(
@@ -172,16 +185,49 @@ async def health_check(request: Request) -> dict:
     }
 
 
-@app.get("/", tags=["Root"])
-async def root() -> dict:
-    """Root endpoint with API information."""
-    return {
+# Steady-state answer when every probe passes, serialized once
+_ALL_HEALTHY_PAYLOAD = orjson.dumps(
+    _health_body({"database": True, "redis": True, "orthanc": True})
+)
+
+
+@app.get("/health", tags=["Health"])
+async def health_check(request: Request) -> Response:
+    """
+    Health check endpoint for container orchestration.
+
+    Returns status of all dependent services. The probes are independent
+    and run concurrently, so the endpoint takes as long as the slowest.
+    """
+    database, redis_status, orthanc = await asyncio.gather(
+        _check_database(), _check_redis(request), _check_orthanc(request)
+    )
+    if database is True and redis_status is True and orthanc is True:
+        return Response(content=_ALL_HEALTHY_PAYLOAD, media_type="application/json")
+
+    return OpenHeartJSONResponse(
+        _health_body(
+            {"database": database, "redis": redis_status, "orthanc": orthanc}
+        )
+    )
+
+
+# Built from settings only, so serialized once at import
+_ROOT_PAYLOAD = orjson.dumps(
+    {
         "name": settings.app_name,
         "version": settings.app_version,
         "description": "Cardiology EMR for Cyprus",
         "docs": "/docs" if not settings.is_production else None,
         "health": "/health",
     }
+)
+
+
+@app.get("/", tags=["Root"])
+async def root() -> Response:
+    """Root endpoint with API information."""
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
 
 # =============================================================================
@@ -6,7 +6,8 @@ status tracking, and encounter handover support.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from sqlalchemy import (
     DateTime,
@@ -46,17 +47,18 @@ class AppointmentStatus(str, Enum):
     NO_SHOW = "no_show"
 
 
-# Default expected durations by appointment type (minutes)
-EXPECTED_DURATIONS: dict[str, int] = {
-    AppointmentType.CONSULTATION: 20,
-    AppointmentType.FOLLOW_UP: 15,
-    AppointmentType.ECHO: 30,
-    AppointmentType.STRESS_TEST: 45,
-    AppointmentType.HOLTER: 15,
-    AppointmentType.PROCEDURE: 60,
-    AppointmentType.ECG: 10,
-    AppointmentType.PRE_OP: 30,
-}
+# Default expected durations by appointment type (minutes), keyed by the
+# plain string stored in Appointment.appointment_type
+EXPECTED_DURATIONS: Mapping[str, int] = MappingProxyType({
+    AppointmentType.CONSULTATION.value: 20,
+    AppointmentType.FOLLOW_UP.value: 15,
+    AppointmentType.ECHO.value: 30,
+    AppointmentType.STRESS_TEST.value: 45,
+    AppointmentType.HOLTER.value: 15,
+    AppointmentType.PROCEDURE.value: 60,
+    AppointmentType.ECG.value: 10,
+    AppointmentType.PRE_OP.value: 30,
+})
 
 
 class Appointment(Base):
@@ -64,7 +66,7 @@ class Appointment(Base):
     Patient appointment with scheduling and encounter linking.
 
     Supports:
-    - Conflict detection via provider + time range index
+    - Conflict detection via a GiST index on provider + time range
     - Duration warnings when scheduled < expected
     - Encounter handover via encounter_id link
     - RLS clinic isolation
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.permissions import Permission, require_permission
+from app.core.responses import OpenHeartJSONResponse
 from app.core.security import TokenPayload, get_current_user
 from app.db.session import get_db
 from app.modules.appointment.models import AppointmentStatus
@@ -24,10 +25,19 @@ from app.modules.appointment.service import AppointmentService
 
 router = APIRouter(prefix="/appointments", tags=["Appointments"])
 
+# Permission dependencies, built once and shared by the routes below
+_DEP_READ = Depends(require_permission(Permission.APPOINTMENT_READ))
+_DEP_WRITE = Depends(require_permission(Permission.APPOINTMENT_WRITE))
+_DEP_DELETE = Depends(require_permission(Permission.APPOINTMENT_DELETE))
+_DEP_ENCOUNTER_WRITE = Depends(require_permission(Permission.ENCOUNTER_WRITE))
 
-def _build_response(appointment) -> AppointmentResponse:
-    """Build response with optional duration warning."""
+
+def _build_response(
+    appointment, patient_name: Optional[str] = None
+) -> AppointmentResponse:
+    """Build response with optional patient name and duration warning."""
     response = AppointmentResponse.model_validate(appointment)
+    response.patient_name = patient_name
     response.duration_warning = check_duration_warning(
         appointment.appointment_type, appointment.duration_minutes
     )
@@ -46,7 +56,7 @@ def _build_response(appointment) -> AppointmentResponse:
 )
 async def create_appointment(
     data: AppointmentCreate,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_WRITE))],
+    user: Annotated[TokenPayload, _DEP_WRITE],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> AppointmentResponse:
     """Create a new appointment with conflict check."""
@@ -64,38 +74,40 @@ async def create_appointment(
 
 @router.get("", response_model=list[AppointmentResponse])
 async def list_appointments(
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_READ))],
+    user: Annotated[TokenPayload, _DEP_READ],
     db: Annotated[AsyncSession, Depends(get_db)],
     from_date: Optional[date] = Query(None, description="Start date filter"),
     to_date: Optional[date] = Query(None, description="End date filter"),
     provider_id: Optional[int] = Query(None, description="Filter by provider"),
     patient_id: Optional[int] = Query(None, description="Filter by patient"),
     appointment_status: Optional[str] = Query(None, alias="status", description="Filter by status"),
-) -> list[AppointmentResponse]:
-    """List appointments with optional filters."""
+) -> OpenHeartJSONResponse:
+    """
+    List appointments with optional filters.
+
+    Rows come back as plain dicts (names joined in the same query),
+    skipping ORM hydration and per-item Pydantic models; response_model
+    is kept for the OpenAPI schema.
+    """
     service = AppointmentService(db, user.clinic_id, user.sub)
-    appointments = await service.list_appointments(
+    items = await service.list_appointments(
         from_date=from_date,
         to_date=to_date,
         provider_id=provider_id,
         patient_id=patient_id,
         status=appointment_status,
     )
-    # Batch-resolve patient names (encrypted PII)
-    patient_ids = list({a.patient_id for a in appointments})
-    name_map = await service.resolve_patient_names(patient_ids)
-    responses = []
-    for a in appointments:
-        resp = _build_response(a)
-        resp.patient_name = name_map.get(a.patient_id)
-        responses.append(resp)
-    return responses
+    for item in items:
+        item["duration_warning"] = check_duration_warning(
+            item["appointment_type"], item["duration_minutes"]
+        )
+    return OpenHeartJSONResponse(items)
 
 
 @router.get("/{appointment_id}", response_model=AppointmentResponse)
 async def get_appointment(
     appointment_id: int,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_READ))],
+    user: Annotated[TokenPayload, _DEP_READ],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> AppointmentResponse:
     """Get appointment details."""
@@ -106,17 +118,15 @@ async def get_appointment(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Appointment not found",
         )
-    resp = _build_response(appointment)
     name_map = await service.resolve_patient_names([appointment.patient_id])
-    resp.patient_name = name_map.get(appointment.patient_id)
-    return resp
+    return _build_response(appointment, name_map.get(appointment.patient_id))
 
 
 @router.put("/{appointment_id}", response_model=AppointmentResponse)
 async def update_appointment(
     appointment_id: int,
     data: AppointmentUpdate,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_WRITE))],
+    user: Annotated[TokenPayload, _DEP_WRITE],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> AppointmentResponse:
     """Update or reschedule an appointment."""
@@ -140,7 +150,7 @@ async def update_appointment(
 @router.delete("/{appointment_id}", response_model=AppointmentResponse)
 async def cancel_appointment(
     appointment_id: int,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_DELETE))],
+    user: Annotated[TokenPayload, _DEP_DELETE],
     db: Annotated[AsyncSession, Depends(get_db)],
     reason: Optional[str] = Query(None, max_length=500),
 ) -> AppointmentResponse:
@@ -170,7 +180,7 @@ async def cancel_appointment(
 @router.post("/{appointment_id}/check-in", response_model=AppointmentResponse)
 async def check_in_appointment(
     appointment_id: int,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_WRITE))],
+    user: Annotated[TokenPayload, _DEP_WRITE],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> AppointmentResponse:
     """Check in a patient for their appointment."""
@@ -194,7 +204,7 @@ async def check_in_appointment(
 @router.post("/{appointment_id}/start-encounter")
 async def start_encounter_from_appointment(
     appointment_id: int,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.ENCOUNTER_WRITE))],
+    user: Annotated[TokenPayload, _DEP_ENCOUNTER_WRITE],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict:
     """Create an encounter from an appointment and link them.
@@ -230,7 +240,7 @@ async def start_encounter_from_appointment(
 async def get_available_slots(
     provider_id: int,
     target_date: date,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_READ))],
+    user: Annotated[TokenPayload, _DEP_READ],
     db: Annotated[AsyncSession, Depends(get_db)],
     duration_minutes: int = Query(30, ge=5, le=480),
 ) -> list[dict]:
@@ -248,7 +258,7 @@ async def check_conflicts(
     provider_id: int,
     start_time: datetime,
     end_time: datetime,
-    user: Annotated[TokenPayload, Depends(require_permission(Permission.APPOINTMENT_READ))],
+    user: Annotated[TokenPayload, _DEP_READ],
     db: Annotated[AsyncSession, Depends(get_db)],
     exclude_id: Optional[int] = Query(None),
 ) -> list[dict]:
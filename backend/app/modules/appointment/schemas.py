@@ -1,6 +1,7 @@
 """Pydantic schemas for the appointments module."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel, field_validator
@@ -86,8 +87,13 @@ class AvailableSlot(BaseModel):
     duration_minutes: int
 
 
+@lru_cache(maxsize=128)
 def check_duration_warning(appointment_type: str, scheduled_minutes: int) -> Optional[str]:
-    """Return warning if scheduled duration seems too short."""
+    """
+    Return warning if scheduled duration seems too short.
+
+    Memoized: list responses repeat the same few (type, duration) pairs.
+    """
     expected = EXPECTED_DURATIONS.get(appointment_type, 30)
     if scheduled_minutes < int(expected * 0.75):
         return (
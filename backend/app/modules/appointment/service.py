@@ -7,15 +7,18 @@ Business logic for appointment scheduling including:
 - Available slot finder
 """
 
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Optional
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, exists, func, insert, lambda_stmt, literal, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.clock import utc_now
 from app.core.encryption import decrypt_pii
 from app.db.session import set_tenant_context
 from app.modules.patient.models import Patient, PatientPII
+from app.modules.patient.service import patient_name_cache
 from app.modules.appointment.models import (
     Appointment,
     AppointmentStatus,
@@ -23,12 +26,47 @@ from app.modules.appointment.models import (
 )
 from app.modules.appointment.schemas import (
     AppointmentCreate,
+    AppointmentResponse,
     AppointmentUpdate,
     ConflictInfo,
     check_duration_warning,
 )
 from app.modules.encounter.models import Encounter, EncounterStatus
 
+_MIDNIGHT = time(0)
+_ONE_DAY = timedelta(days=1)
+
+# Appointment columns exposed by AppointmentResponse, in field order; the
+# list query projects just these instead of loading ORM objects
+LIST_FIELDS = tuple(
+    name
+    for name in AppointmentResponse.model_fields
+    if name not in ("patient_name", "duration_warning")
+)
+_LIST_COLUMNS = tuple(getattr(Appointment, name) for name in LIST_FIELDS)
+
+# Appointments in these states no longer occupy the provider's time
+_INACTIVE_STATUSES = (
+    AppointmentStatus.CANCELLED.value,
+    AppointmentStatus.NO_SHOW.value,
+)
+
+# Exclusion constraint (migration 0010) rejecting overlapping active
+# appointments for a provider
+_OVERLAP_CONSTRAINT = "excl_appointments_provider_overlap"
+
+
+def _decrypt_name(first_encrypted: str, last_encrypted: str) -> str:
+    """Decrypt a patient's first and last name into a display name."""
+    first = decrypt_pii(first_encrypted)
+    last = decrypt_pii(last_encrypted)
+    return f"{first} {last}".strip()
+
+
+def _is_overlap_violation(error: IntegrityError) -> bool:
+    """Whether error was raised by the provider overlap constraint."""
+    return _OVERLAP_CONSTRAINT in str(error.orig)
+
 
 class AppointmentService:
     """Service class for appointment operations."""
@@ -45,42 +83,73 @@ class AppointmentService:
     async def create_appointment(
         self, data: AppointmentCreate
     ) -> Appointment:
-        """Create a new appointment with conflict check."""
+        """
+        Create a new appointment with conflict check.
+
+        The NOT EXISTS check in the INSERT cannot see bookings from
+        transactions that have not committed yet, so two concurrent
+        requests may both pass it; the overlap exclusion constraint then
+        rejects the later one, reported as the same conflict.
+
+        Raises:
+            ValueError: If the provider already has an overlapping
+                active appointment
+        """
         await self._set_tenant()
 
         end_time = data.start_time + timedelta(minutes=data.duration_minutes)
         expected = EXPECTED_DURATIONS.get(data.appointment_type.value, 30)
 
-        # Check for conflicts
-        conflicts = await self.check_conflicts(
-            data.provider_id, data.start_time, end_time
-        )
-        if conflicts:
-            raise ValueError(
-                f"Scheduling conflict: provider already has an appointment "
-                f"from {conflicts[0].start_time} to {conflicts[0].end_time}"
+        values = {
+            "clinic_id": self.clinic_id,
+            "patient_id": data.patient_id,
+            "provider_id": data.provider_id,
+            "start_time": data.start_time,
+            "end_time": end_time,
+            "duration_minutes": data.duration_minutes,
+            "expected_duration_minutes": expected,
+            "appointment_type": data.appointment_type.value,
+            "status": AppointmentStatus.SCHEDULED.value,
+            "reason": data.reason,
+            "notes": data.notes,
+            "location": data.location,
+            "gesy_referral_id": data.gesy_referral_id,
+            "created_by": self.user_id,
+        }
+        columns = Appointment.__table__.c
+        overlap = self._overlap_criteria(data.provider_id, data.start_time, end_time)
+
+        # Insert only if the provider is free, in a single statement:
+        # INSERT ... SELECT ... WHERE NOT EXISTS (overlapping appointment)
+        stmt = (
+            insert(Appointment)
+            .from_select(
+                list(values),
+                select(
+                    *(literal(v, type_=columns[k].type) for k, v in values.items())
+                ).where(~exists().where(*overlap)),
             )
-
-        appointment = Appointment(
-            clinic_id=self.clinic_id,
-            patient_id=data.patient_id,
-            provider_id=data.provider_id,
-            start_time=data.start_time,
-            end_time=end_time,
-            duration_minutes=data.duration_minutes,
-            expected_duration_minutes=expected,
-            appointment_type=data.appointment_type.value,
-            status=AppointmentStatus.SCHEDULED.value,
-            reason=data.reason,
-            notes=data.notes,
-            location=data.location,
-            gesy_referral_id=data.gesy_referral_id,
-            created_by=self.user_id,
+            .returning(Appointment)
         )
-
-        self.session.add(appointment)
-        await self.session.flush()
-        await self.session.refresh(appointment)
+        try:
+            appointment = (await self.session.execute(stmt)).scalar_one_or_none()
+        except IntegrityError as e:
+            if not _is_overlap_violation(e):
+                raise
+            # Lost the race to a concurrent booking. The transaction is
+            # aborted, so the conflicting row cannot be looked up here.
+            raise ValueError("Scheduling conflict: provider is not available") from e
+        if appointment is None:
+            # Nothing inserted: look up the conflict for the error message
+            conflicts = await self.check_conflicts(
+                data.provider_id, data.start_time, end_time
+            )
+            if conflicts:
+                raise ValueError(
+                    f"Scheduling conflict: provider already has an appointment "
+                    f"from {conflicts[0].start_time} to {conflicts[0].end_time}"
+                )
+            raise ValueError("Scheduling conflict: provider is not available")
         return appointment
 
     async def get_appointment(self, appointment_id: int) -> Optional[Appointment]:
@@ -95,18 +164,33 @@ class AppointmentService:
         provider_id: Optional[int] = None,
         patient_id: Optional[int] = None,
         status: Optional[str] = None,
-    ) -> list[Appointment]:
-        """List appointments with optional filters."""
+    ) -> list[dict]:
+        """
+        List appointments with optional filters.
+
+        Patient names are fetched in the same query through a join on the
+        encrypted PII and decrypted once per distinct patient.
+
+        Returns:
+            Dicts holding the LIST_FIELDS columns plus patient_name,
+            ordered by start time
+        """
         await self._set_tenant()
 
-        stmt = select(Appointment).where(
-            Appointment.clinic_id == self.clinic_id
+        stmt = (
+            select(
+                *_LIST_COLUMNS,
+                PatientPII.first_name_encrypted,
+                PatientPII.last_name_encrypted,
+            )
+            .outerjoin(PatientPII, PatientPII.patient_id == Appointment.patient_id)
+            .where(Appointment.clinic_id == self.clinic_id)
         )
 
         if from_date:
-            stmt = stmt.where(Appointment.start_time >= datetime.combine(from_date, datetime.min.time()))
+            stmt = stmt.where(Appointment.start_time >= datetime.combine(from_date, _MIDNIGHT))
         if to_date:
-            stmt = stmt.where(Appointment.start_time < datetime.combine(to_date + timedelta(days=1), datetime.min.time()))
+            stmt = stmt.where(Appointment.start_time < datetime.combine(to_date + _ONE_DAY, _MIDNIGHT))
         if provider_id:
             stmt = stmt.where(Appointment.provider_id == provider_id)
         if patient_id:
@@ -116,24 +200,63 @@ class AppointmentService:
 
         stmt = stmt.order_by(Appointment.start_time)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+
+        names: dict[int, Optional[str]] = {}
+        items = []
+        for row in result.all():
+            item = dict(zip(LIST_FIELDS, row))
+            if row.patient_id not in names:
+                names[row.patient_id] = self._cached_name(
+                    row.patient_id, row.first_name_encrypted, row.last_name_encrypted
+                )
+            item["patient_name"] = names[row.patient_id]
+            items.append(item)
+        return items
+
+    def _cached_name(
+        self,
+        patient_id: int,
+        first_encrypted: Optional[str],
+        last_encrypted: Optional[str],
+    ) -> Optional[str]:
+        """Return the patient's display name, decrypting only on a cache miss."""
+        if first_encrypted is None:
+            return None
+        key = (self.clinic_id, patient_id)
+        name = patient_name_cache.get(key)
+        if name is None:
+            name = _decrypt_name(first_encrypted, last_encrypted)
+            patient_name_cache[key] = name
+        return name
 
     async def resolve_patient_names(self, patient_ids: list[int]) -> dict[int, str]:
-        """Batch-resolve decrypted patient names for a list of patient IDs."""
-        if not patient_ids:
-            return {}
+        """
+        Batch-resolve decrypted patient names for a list of patient IDs.
+
+        Names cached for this clinic are served without a query; the rest
+        are fetched in one SELECT, decrypted and cached.
+        """
+        name_map: dict[int, str] = {}
+        misses = []
+        for patient_id in patient_ids:
+            name = patient_name_cache.get((self.clinic_id, patient_id))
+            if name is None:
+                misses.append(patient_id)
+            else:
+                name_map[patient_id] = name
+        if not misses:
+            return name_map
 
         stmt = (
             select(Patient.patient_id, PatientPII.first_name_encrypted, PatientPII.last_name_encrypted)
             .join(PatientPII, Patient.patient_id == PatientPII.patient_id)
-            .where(Patient.patient_id.in_(patient_ids))
+            .where(Patient.patient_id.in_(misses))
         )
         result = await self.session.execute(stmt)
-        name_map: dict[int, str] = {}
         for row in result.all():
-            first = decrypt_pii(row.first_name_encrypted)
-            last = decrypt_pii(row.last_name_encrypted)
-            name_map[row.patient_id] = f"{first} {last}".strip()
+            name = _decrypt_name(row.first_name_encrypted, row.last_name_encrypted)
+            patient_name_cache[(self.clinic_id, row.patient_id)] = name
+            name_map[row.patient_id] = name
         return name_map
 
     async def update_appointment(
@@ -189,9 +312,14 @@ class AppointmentService:
         if data.provider_id:
             appointment.provider_id = data.provider_id
 
-        appointment.updated_at = func.now()
-        await self.session.flush()
-        await self.session.refresh(appointment)
+        appointment.updated_at = utc_now()
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            if not _is_overlap_violation(e):
+                raise
+            # A concurrent booking took the slot after check_conflicts ran
+            raise ValueError("Scheduling conflict: provider is not available") from e
         return appointment
 
     async def cancel_appointment(
@@ -212,14 +340,14 @@ class AppointmentService:
         ):
             raise ValueError("Cannot cancel a completed or already cancelled appointment")
 
+        now = utc_now()
         appointment.status = AppointmentStatus.CANCELLED.value
-        appointment.cancelled_at = func.now()
+        appointment.cancelled_at = now
         appointment.cancelled_by = self.user_id
         appointment.cancellation_reason = reason
-        appointment.updated_at = func.now()
+        appointment.updated_at = now
 
         await self.session.flush()
-        await self.session.refresh(appointment)
         return appointment
 
     async def check_in(self, appointment_id: int) -> Optional[Appointment]:
@@ -239,10 +367,9 @@ class AppointmentService:
             )
 
         appointment.status = AppointmentStatus.CHECKED_IN.value
-        appointment.updated_at = func.now()
+        appointment.updated_at = utc_now()
 
         await self.session.flush()
-        await self.session.refresh(appointment)
         return appointment
 
     async def start_encounter_from_appointment(
@@ -273,31 +400,50 @@ class AppointmentService:
                 f"Cannot start encounter: appointment status is '{appointment.status}'"
             )
 
-        # Create encounter from appointment data
-        encounter = Encounter(
-            patient_id=appointment.patient_id,
-            clinic_id=self.clinic_id,
-            attending_physician_id=appointment.provider_id,
-            encounter_type="outpatient",
-            status=EncounterStatus.IN_PROGRESS.value,
-            scheduled_start=appointment.start_time,
-            actual_start=func.now(),
-            chief_complaint=appointment.reason,
-            location=appointment.location,
-            gesy_referral_id=appointment.gesy_referral_id,
+        # Create encounter from appointment data; RETURNING hands back the
+        # fully populated row, so no flush + refresh is needed
+        result = await self.session.execute(
+            insert(Encounter)
+            .values(
+                patient_id=appointment.patient_id,
+                clinic_id=self.clinic_id,
+                attending_physician_id=appointment.provider_id,
+                encounter_type="outpatient",
+                status=EncounterStatus.IN_PROGRESS.value,
+                scheduled_start=appointment.start_time,
+                actual_start=func.now(),
+                chief_complaint=appointment.reason,
+                location=appointment.location,
+                gesy_referral_id=appointment.gesy_referral_id,
+            )
+            .returning(Encounter)
         )
-        self.session.add(encounter)
-        await self.session.flush()
+        encounter = result.scalar_one()
 
         # Link appointment to encounter
         appointment.encounter_id = encounter.encounter_id
         appointment.status = AppointmentStatus.IN_PROGRESS.value
-        appointment.updated_at = func.now()
+        appointment.updated_at = utc_now()
 
         await self.session.flush()
-        await self.session.refresh(encounter)
         return encounter
 
+    @staticmethod
+    def _overlap_criteria(
+        provider_id: int, start_time: datetime, end_time: datetime
+    ) -> tuple:
+        """WHERE criteria matching a provider's active appointments in a window."""
+        return (
+            Appointment.provider_id == provider_id,
+            Appointment.status.not_in(_INACTIVE_STATUSES),
+            # Half-open ranges overlap exactly when existing.start < new.end
+            # AND existing.end > new.start; this form matches the GiST index
+            # idx_appointments_provider_range
+            func.tstzrange(Appointment.start_time, Appointment.end_time).op("&&")(
+                func.tstzrange(start_time, end_time)
+            ),
+        )
+
     async def check_conflicts(
         self,
         provider_id: int,
@@ -306,22 +452,26 @@ class AppointmentService:
         exclude_id: Optional[int] = None,
     ) -> list[ConflictInfo]:
         """Check for overlapping appointments for a provider."""
-        stmt = select(Appointment).where(
-            Appointment.provider_id == provider_id,
-            Appointment.status.not_in([
-                AppointmentStatus.CANCELLED.value,
-                AppointmentStatus.NO_SHOW.value,
-            ]),
-            # Overlap: existing.start < new.end AND existing.end > new.start
-            Appointment.start_time < end_time,
-            Appointment.end_time > start_time,
+        # Only the ConflictInfo columns are needed; skip ORM hydration.
+        # Built as a lambda statement so the construction is cached and
+        # later calls only swap in the new bound values.
+        stmt = lambda_stmt(
+            lambda: select(
+                Appointment.appointment_id,
+                Appointment.patient_id,
+                Appointment.start_time,
+                Appointment.end_time,
+                Appointment.appointment_type,
+            ).where(
+                *AppointmentService._overlap_criteria(provider_id, start_time, end_time)
+            )
         )
 
         if exclude_id:
-            stmt = stmt.where(Appointment.appointment_id != exclude_id)
+            stmt += lambda s: s.where(Appointment.appointment_id != exclude_id)
 
         result = await self.session.execute(stmt)
-        appointments = result.scalars().all()
+        appointments = result.all()
 
         return [
             ConflictInfo(
@@ -345,44 +495,45 @@ class AppointmentService:
         """Find available time slots for a provider on a given date."""
         await self._set_tenant()
 
-        from_dt = datetime.combine(target_date, datetime.min.time().replace(hour=start_hour))
-        to_dt = datetime.combine(target_date, datetime.min.time().replace(hour=end_hour))
+        from_dt = datetime.combine(target_date, time(start_hour))
+        to_dt = datetime.combine(target_date, time(end_hour))
 
-        # Get existing appointments for the day
-        stmt = (
-            select(Appointment)
+        # Get existing appointment windows for the day (cached lambda
+        # statement, as in check_conflicts)
+        stmt = lambda_stmt(
+            lambda: select(Appointment.start_time, Appointment.end_time)
             .where(
                 Appointment.provider_id == provider_id,
                 Appointment.start_time >= from_dt,
                 Appointment.start_time < to_dt,
-                Appointment.status.not_in([
-                    AppointmentStatus.CANCELLED.value,
-                    AppointmentStatus.NO_SHOW.value,
-                ]),
+                Appointment.status.not_in(_INACTIVE_STATUSES),
             )
             .order_by(Appointment.start_time)
         )
         result = await self.session.execute(stmt)
-        existing = list(result.scalars().all())
+        existing = result.all()
 
         # Find gaps
         slots = []
+        slot_length = timedelta(minutes=duration_minutes)
         current = from_dt
 
         for appt in existing:
-            if current + timedelta(minutes=duration_minutes) <= appt.start_time:
+            slot_end = current + slot_length
+            if slot_end <= appt.start_time:
                 slots.append({
                     "start_time": current.isoformat(),
-                    "end_time": (current + timedelta(minutes=duration_minutes)).isoformat(),
+                    "end_time": slot_end.isoformat(),
                     "duration_minutes": duration_minutes,
                 })
             current = max(current, appt.end_time)
 
         # Check remaining time after last appointment
-        if current + timedelta(minutes=duration_minutes) <= to_dt:
+        slot_end = current + slot_length
+        if slot_end <= to_dt:
             slots.append({
                 "start_time": current.isoformat(),
-                "end_time": (current + timedelta(minutes=duration_minutes)).isoformat(),
+                "end_time": slot_end.isoformat(),
                 "duration_minutes": duration_minutes,
             })
 
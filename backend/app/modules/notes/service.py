@@ -503,7 +503,7 @@ class NoteService:
 
         try:
             storage = get_storage_client()
-            storage.upload_file(
+            await storage.upload_file(
                 bucket=storage_bucket,
                 key=storage_path,
                 content=file_content,
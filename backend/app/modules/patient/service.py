@@ -17,6 +17,7 @@ from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import TTLCache
 from app.core.encryption import (
     decrypt_pii,
     decrypt_pii_optional,
@@ -53,6 +54,20 @@ from app.modules.clinic.models import User
 
 logger = logging.getLogger(__name__)
 
+# Decrypted Cyprus ID keyed by (clinic_id, patient_id), used as the DICOM
+# Patient ID for Orthanc lookups. Empty string means the patient has no
+# Cyprus ID on file. Invalidated on patient update and anonymization.
+cyprus_id_cache: TTLCache[tuple[int, int], str] = TTLCache(
+    maxsize=10_000, ttl=300
+)
+
+# Decrypted display name ("First Last") keyed by (clinic_id, patient_id), so
+# a hit never crosses the RLS tenant boundary. Used by appointment listings.
+# Invalidated on patient update and anonymization.
+patient_name_cache: TTLCache[tuple[int, int], str] = TTLCache(
+    maxsize=10_000, ttl=300
+)
+
 
 class PatientService:
     """Service for managing patients with encrypted PII."""
@@ -297,6 +312,8 @@ class PatientService:
 
         await self.db.commit()
         await self.db.refresh(patient)
+        cyprus_id_cache.pop((clinic_id, patient_id))
+        patient_name_cache.pop((clinic_id, patient_id))
 
         return patient
 
@@ -1041,6 +1058,8 @@ class PatientService:
         erasure_request.execution_details = execution_details
 
         await self.db.commit()
+        cyprus_id_cache.pop((clinic_id, patient.patient_id))
+        patient_name_cache.pop((clinic_id, patient.patient_id))
 
         logger.info(
             f"GDPR erasure executed for patient {erasure_request.patient_id}: "
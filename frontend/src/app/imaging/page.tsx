@@ -43,8 +43,10 @@ function ImagingBrowserContent() {
 
   // Data state
   const [studies, setStudies] = useState<DicomStudy[]>([]);
-  const [total, setTotal] = useState(0);
+  const [total, setTotal] = useState<number | undefined>(undefined);
   const [page, setPage] = useState(1);
+  // cursors[i] fetches page i + 1; the first page needs none
+  const [cursors, setCursors] = useState<(string | undefined)[]>([undefined]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -53,6 +55,7 @@ function ImagingBrowserContent() {
     const timer = setTimeout(() => {
       setDebouncedSearch(patientSearch);
       setPage(1);
+      setCursors([undefined]);
     }, 300);
     return () => clearTimeout(timer);
   }, [patientSearch]);
@@ -60,6 +63,7 @@ function ImagingBrowserContent() {
   // Reset page when filters change
   useEffect(() => {
     setPage(1);
+    setCursors([undefined]);
   }, [modalityFilter, dateFrom, dateTo]);
 
   // Fetch studies
@@ -73,6 +77,7 @@ function ImagingBrowserContent() {
         const params: StudySearchParams = {
           page,
           per_page: PER_PAGE,
+          cursor: cursors[page - 1],
         };
         if (debouncedSearch) params.patient_name = debouncedSearch;
         if (modalityFilter) params.modality = modalityFilter;
@@ -82,6 +87,7 @@ function ImagingBrowserContent() {
         const result = await searchStudies(session.accessToken, params);
         setStudies(result.studies);
         setTotal(result.total);
+        setCursors((prev) => [...prev.slice(0, page), result.next_cursor]);
       } catch (err) {
         setError(err instanceof Error ? err.message : "Failed to load studies");
       } finally {
@@ -92,7 +98,7 @@ function ImagingBrowserContent() {
     fetchStudies();
   }, [session?.accessToken, debouncedSearch, modalityFilter, dateFrom, dateTo, page]);
 
-  const totalPages = Math.ceil(total / PER_PAGE);
+  const hasNextPage = Boolean(cursors[page]);
 
   const handleViewStudy = async (study: DicomStudy) => {
     if (!session?.accessToken) return;
@@ -202,7 +208,9 @@ function ImagingBrowserContent() {
         {/* Toolbar: results count + view mode */}
         <div className="mb-4 flex items-center justify-between">
           <p className="text-sm text-slate-400">
-            {loading ? "Loading..." : `${total} ${total === 1 ? "study" : "studies"} found`}
+            {loading ? "Loading..." : total !== undefined
+                ? `${total} ${total === 1 ? "study" : "studies"} found`
+                : `${(page - 1) * PER_PAGE + studies.length}+ studies found`}
           </p>
           <div className="flex items-center gap-1 rounded-lg border border-white/10 bg-slate-900/50 p-1">
             <button
@@ -276,7 +284,7 @@ function ImagingBrowserContent() {
         )}
 
         {/* Pagination */}
-        {totalPages > 1 && (
+        {(page > 1 || hasNextPage) && (
           <div className="mt-6 flex items-center justify-center gap-3">
             <button
               onClick={() => setPage((p) => Math.max(1, p - 1))}
@@ -287,11 +295,11 @@ function ImagingBrowserContent() {
               Previous
             </button>
             <span className="text-sm text-slate-400">
-              Page {page} of {totalPages}
+              Page {page}
             </span>
             <button
-              onClick={() => setPage((p) => Math.min(totalPages, p + 1))}
-              disabled={page === totalPages}
+              onClick={() => setPage((p) => p + 1)}
+              disabled={!hasNextPage}
               className="flex items-center gap-1 rounded-lg border border-white/10 bg-white/5 px-3 py-2 text-sm text-slate-300 transition-colors hover:bg-white/10 disabled:opacity-40 disabled:cursor-not-allowed"
             >
               Next
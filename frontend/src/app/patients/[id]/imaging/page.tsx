@@ -66,7 +66,7 @@ export default function PatientImagingPage() {
 
       const result = await searchStudies(accessToken, params);
       setStudies(result.studies);
-      setTotal(result.total);
+      setTotal(result.total ?? result.studies.length);
     } catch (err) {
       setError(
         err instanceof Error ? err.message : "Failed to load imaging studies"
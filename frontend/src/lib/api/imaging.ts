@@ -29,6 +29,8 @@ export interface DicomSeries {
   modality: Modality;
   body_part?: string;
   instance_count: number;
+  /** Base64 JPEG, present only when requested with prefetch_thumbnails. */
+  thumbnail?: string;
 }
 
 export interface DicomStudy {
@@ -51,9 +53,12 @@ export interface DicomStudy {
 
 export interface DicomStudyList {
   studies: DicomStudy[];
-  total: number;
+  /** @deprecated Only present when the full result size is known. */
+  total?: number;
   page: number;
   per_page: number;
+  has_next: boolean;
+  next_cursor?: string;
 }
 
 export interface ViewerUrlResponse {
@@ -73,6 +78,7 @@ export interface StudySearchParams {
   linked_patient_id?: number;
   page?: number;
   per_page?: number;
+  cursor?: string;
 }
 
 export interface EchoMeasurements {
@@ -149,6 +155,7 @@ export async function searchStudies(
     searchParams.append("linked_patient_id", String(params.linked_patient_id));
   if (params.page) searchParams.append("page", String(params.page));
   if (params.per_page) searchParams.append("per_page", String(params.per_page));
+  if (params.cursor) searchParams.append("cursor", params.cursor);
 
   return apiClient.get<DicomStudyList>(
     `/api/dicom/studies?${searchParams.toString()}`,